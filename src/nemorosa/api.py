@@ -534,6 +534,10 @@ def get_api_instance(server: str, cookies: dict | None = None, api_key: str | No
 _target_apis_instance: list[GazelleJSONAPI | GazelleParser] = []
 _target_apis_lock = threading.Lock()
 
+# Tracker queries of the target APIs, derived once whenever the APIs are set
+_target_trackers: list[str] = []
+_target_tracker_set: frozenset[str] = frozenset()
+
 
 def get_target_apis() -> list[GazelleJSONAPI | GazelleParser]:
     """Get global target_apis instance.
@@ -550,9 +554,31 @@ def set_target_apis(target_apis: list[GazelleJSONAPI | GazelleParser]) -> None:
     Args:
         target_apis: List of target API connections to set as current.
     """
-    global _target_apis_instance
+    global _target_apis_instance, _target_trackers, _target_tracker_set
     with _target_apis_lock:
         _target_apis_instance = target_apis
+        _target_trackers = [api_instance.tracker_query for api_instance in target_apis]
+        _target_tracker_set = frozenset(_target_trackers)
+
+
+def get_target_trackers() -> list[str]:
+    """Get tracker queries of the target APIs, in target site order.
+
+    The list is shared, callers must not modify it.
+
+    Returns:
+        list[str]: Tracker query of each target API.
+    """
+    return _target_trackers
+
+
+def get_target_tracker_set() -> frozenset[str]:
+    """Get tracker queries of the target APIs as a set for membership checks.
+
+    Returns:
+        frozenset[str]: Tracker queries of all target APIs.
+    """
+    return _target_tracker_set
 
 
 async def setup_api_connections(target_sites: list[TargetSiteConfig]):
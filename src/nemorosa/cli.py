@@ -156,8 +156,9 @@ async def async_init():
         logger.info("Rebuilding client torrents cache...")
 
         # Get all torrents from the new client
-        all_torrents = app_torrent_client.get_torrents(
-            fields=["hash", "name", "total_size", "files", "trackers", "download_dir"]
+        all_torrents = await app_torrent_client.run_blocking(
+            app_torrent_client.get_torrents,
+            fields=["hash", "name", "total_size", "files", "trackers", "download_dir"],
         )
 
         # Validate that the new client has torrents
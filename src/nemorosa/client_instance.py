@@ -59,6 +59,11 @@ def get_torrent_client() -> TorrentClient:
         TorrentClient: Torrent client instance.
     """
     global _torrent_client_instance
+    # Fast path without locking once the instance exists
+    torrent_client = _torrent_client_instance
+    if torrent_client is not None:
+        return torrent_client
+
     with _torrent_client_lock:
         if _torrent_client_instance is None:
             # Get client URL from config
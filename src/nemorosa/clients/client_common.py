@@ -1,24 +1,49 @@
 import asyncio
+import contextlib
+import functools
+import heapq
 import posixpath
+import random
 import shutil
-import threading
+import sys
 import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from datetime import UTC, datetime, timedelta
-from enum import Enum
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from enum import StrEnum
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
 import msgspec
 import torf
 from apscheduler.triggers.date import DateTrigger
-from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy.exc import SQLAlchemyError
 
 from .. import config, db, filecompare, logger, scheduler
 
+# Decoder for tracker lists stored as JSON in the client torrents cache
+_trackers_decoder = msgspec.json.Decoder(list[str])
 
-def decode_bitfield_bytes(bitfield_data: bytes, piece_count: int) -> list[bool]:
+# Tracker URLs longer than this are not interned during filtering
+_MAX_INTERNED_URL_LENGTH = 256
+
+# Bounds for memoized tracker matching: distinct tracker URLs remembered per matcher,
+# and distinct substring lists (normally just check_trackers and the target trackers)
+_TRACKER_MATCH_CACHE_SIZE = 4096
+_MAX_TRACKER_MATCHERS = 8
+
+
+@functools.lru_cache(maxsize=65536)
+def _file_ext(name: str) -> str:
+    """Get the lowercased extension of a file name, memoized so filters don't re-split names on each pass."""
+    return posixpath.splitext(name)[1].lower()
+
+
+# Each possible bitfield byte expanded to 8 piece bytes, most significant bit first
+_BITFIELD_LUT = tuple(bytes((value >> bit) & 1 for bit in range(7, -1, -1)) for value in range(256))
+
+
+def decode_bitfield_bytes(bitfield_data: bytes, piece_count: int) -> bytes:
     """Decode bitfield bytes data to get piece download status.
 
     This is a common utility function used by different torrent clients to decode
@@ -29,20 +54,11 @@ def decode_bitfield_bytes(bitfield_data: bytes, piece_count: int) -> list[bool]:
         piece_count: Total number of pieces in the torrent
 
     Returns:
-        List of boolean values indicating piece download status
+        One byte per piece, 1 if the piece has been downloaded and 0 otherwise
     """
-    piece_progress = [False] * piece_count
-
-    for byte_index in range(min(len(bitfield_data), (piece_count + 7) // 8)):
-        byte_value = bitfield_data[byte_index]
-        start_piece = byte_index * 8
-        end_piece = min(start_piece + 8, piece_count)
-
-        for bit_offset in range(end_piece - start_piece):
-            bit_index = 7 - bit_offset
-            piece_progress[start_piece + bit_offset] = bool(byte_value & (1 << bit_index))
-
-    return piece_progress
+    # Expand whole bytes via lookup table, pad pieces missing from short bitfields as not downloaded
+    piece_progress = b"".join(map(_BITFIELD_LUT.__getitem__, bitfield_data[: (piece_count + 7) // 8]))
+    return piece_progress[:piece_count].ljust(piece_count, b"\x00")
 
 
 class PostProcessResult(msgspec.Struct, frozen=False):
@@ -70,8 +86,11 @@ class FieldSpec(msgspec.Struct):
             return set()
 
 
-class TorrentState(Enum):
-    """Torrent download state enumeration."""
+class TorrentState(StrEnum):
+    """Torrent download state enumeration.
+
+    Members are also strings, so they compare equal to their raw values (e.g. "seeding").
+    """
 
     UNKNOWN = "unknown"
     DOWNLOADING = "downloading"
@@ -90,19 +109,33 @@ class TorrentState(Enum):
         return self != TorrentState.UNKNOWN
 
 
+# States in which a torrent is no longer checking, allocating or moving
+_VERIFICATION_DONE_STATES = frozenset({TorrentState.PAUSED, TorrentState.COMPLETED, TorrentState.SEEDING})
+
+
 class TorrentConflictError(Exception):
     """Exception raised when torrent cannot coexist with local torrent due to source flag issues."""
 
     pass
 
 
-class ClientTorrentFile(msgspec.Struct):
-    """Represents a file within a torrent from torrent client."""
+class ClientTorrentFile(msgspec.Struct, gc=False):
+    """Represents a file within a torrent from torrent client.
+
+    Holds only scalar fields and can never be part of a reference cycle, so it is excluded
+    from garbage collector tracking; torrents with tens of thousands of files would
+    otherwise make every collection walk all of them.
+    """
 
     name: str
     size: int
     progress: float  # File download progress (0.0 to 1.0)
 
+    @property
+    def ext(self) -> str:
+        """Lowercased extension with leading dot, derived from name."""
+        return _file_ext(self.name)
+
 
 class ClientTorrentInfo(msgspec.Struct):
     """Represents a torrent with all its information from torrent client."""
@@ -116,7 +149,7 @@ class ClientTorrentInfo(msgspec.Struct):
     download_dir: str = ""
     state: TorrentState = TorrentState.UNKNOWN  # Torrent state
     existing_target_trackers: list[str] = []
-    piece_progress: list[bool] = []  # Piece download status
+    piece_progress: bytes = b""  # Piece download status, one byte per piece (1 = downloaded)
 
     @property
     def fdict(self) -> dict[str, int]:
@@ -127,7 +160,36 @@ class ClientTorrentInfo(msgspec.Struct):
         """
         if not self.files or not self.name:
             return {}
-        return {posixpath.relpath(f.name, self.name): f.size for f in self.files}
+        # File names almost always start with "<name>/", slicing avoids relpath's normalization work
+        prefix = self.name + "/"
+        prefix_len = len(prefix)
+        return {
+            (name[prefix_len:] if (name := f.name).startswith(prefix) else posixpath.relpath(name, self.name)): f.size
+            for f in self.files
+        }
+
+
+def _scan_file_types(files: list[ClientTorrentFile], stop_at_music: bool) -> tuple[bool, bool]:
+    """Detect MP3 and music files in a single pass over a torrent's files.
+
+    Args:
+        files (list[ClientTorrentFile]): Torrent files.
+        stop_at_music (bool): Stop at the first music file, when MP3 presence doesn't matter.
+
+    Returns:
+        tuple[bool, bool]: (has_mp3, has_music).
+    """
+    has_music = False
+    for file in files:
+        ext = file.ext
+        if ext == ".mp3":
+            # MP3 is a music extension too, nothing left to learn
+            return True, True
+        if not has_music and filecompare.is_music_file_ext(ext):
+            has_music = True
+            if stop_at_music:
+                break
+    return False, has_music
 
 
 class TorrentClient(ABC):
@@ -137,16 +199,67 @@ class TorrentClient(ABC):
         # Monitoring state
         self.monitoring = False
         # key: torrent_hash, value: is_verifying (False=delayed, True=verifying)
+        # Only touched from the event loop, so no lock is needed
         self._tracked_torrents: dict[str, bool] = {}
-        self._monitor_lock = threading.Lock()
         self._torrents_processed_event = asyncio.Event()  # Event to signal when all torrents are processed
-
-        # Job configuration
-        self._monitor_job_id = "torrent_monitor"
+        self._state_change_event = asyncio.Event()  # Wakes the monitor when tracked torrents change
+        self._monitor_task: asyncio.Task | None = None
+        # (deadline, torrent_hash) min-heap of delayed torrents waiting to be promoted to verifying,
+        # with the latest deadline per hash so entries from earlier registrations are ignored
+        self._pending_activations: list[tuple[float, str]] = []
+        self._activation_deadlines: dict[str, float] = {}
+        self._verification_start_delay = 5.0
+
+        # Seconds between client polls while torrents are verifying, backing off while nothing completes
+        self._monitor_min_poll_interval = 1.0
+        self._monitor_max_poll_interval = 5.0
+
+        # Pending coalesced torrent info lookups, keyed by requested fields:
+        # (hashes of each caller, future resolved with the batch result, flush task)
+        self._info_batches: dict[tuple[str, ...], tuple[list[set[str]], asyncio.Future, asyncio.Task]] = {}
 
         # Get global job manager
         self.job_manager = scheduler.get_job_manager()
 
+        # Bind database handle once instead of looking it up per operation
+        self.database = db.get_database()
+
+        # Memoized tracker URL matchers keyed by the substrings they look for
+        self._tracker_matchers: dict[tuple[str, ...], Callable[[str], tuple[str, ...]]] = {}
+
+        # (built_at, {torrent_name: [trackers, ...]}) snapshot used by get_single_torrent
+        self._name_index_cache: tuple[float, dict[str, list[list[str]]]] | None = None
+        # Bumped on every invalidation, so a torrent list fetched before an inject can't be cached after it
+        self._name_index_generation = 0
+
+        # Resolved (field_config, request arguments) per requested fields, see _resolve_field_config
+        self._field_config_cache: dict[tuple[str, ...] | None, tuple[dict[str, Any], list[str]]] = {}
+
+        # Generated ClientTorrentInfo constructors per requested fields, see _get_torrent_info_builder
+        self._info_builders: dict[tuple[str, ...] | None, Callable[[Any], ClientTorrentInfo]] = {}
+
+        # Single worker thread for every blocking client RPC issued from async code, so long calls
+        # don't stall the event loop. The underlying client libraries are not thread-safe, so all
+        # calls from async code must go through run_blocking to stay serialized on this one thread
+        self._rpc_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nemorosa-rpc")
+
+    async def run_blocking(self, func: Callable[..., Any], /, *args, **kwargs) -> Any:
+        """Run a blocking client call on the RPC thread and await its result.
+
+        Async code must not call client methods directly, otherwise the client object
+        would be used from the event loop thread and the RPC thread at the same time.
+
+        Args:
+            func: Blocking callable, usually a bound method of this client.
+            *args: Positional arguments for func.
+            **kwargs: Keyword arguments for func.
+
+        Returns:
+            Any: Return value of func.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._rpc_executor, functools.partial(func, *args, **kwargs))
+
     # region Abstract Public
 
     @abstractmethod
@@ -311,18 +424,18 @@ class TorrentClient(ABC):
             torrents (list[ClientTorrentInfo]): List of torrents to cache.
         """
         try:
-            database = db.get_database()
-            await database.clear_client_torrents_cache()
+            await self.database.clear_client_torrents_cache()
 
             if not torrents:
                 logger.debug("No torrents provided for cache rebuild")
                 return
 
             # Batch save to database
-            await database.batch_save_client_torrents(torrents)
+            await self.database.batch_save_client_torrents(torrents)
             logger.success(f"Cached {len(torrents)} torrents to database")
+            await self.database.checkpoint()
 
-        except Exception as e:
+        except SQLAlchemyError as e:
             logger.warning(f"Failed to rebuild cache: {e}")
 
     async def rebuild_client_torrents_cache_incremental(self, torrents: list[ClientTorrentInfo]):
@@ -337,31 +450,30 @@ class TorrentClient(ABC):
             torrents (list[ClientTorrentInfo]): List of torrents to rebuild cache with.
         """
         try:
-            database = db.get_database()
-
             if not torrents:
                 logger.debug("No torrents provided for cache sync")
                 # Clear all cached torrents if the new list is empty
-                await database.clear_client_torrents_cache()
+                await self.database.clear_client_torrents_cache()
                 return
 
             # Get current cached torrent hashes
-            cached_hashes = await database.get_all_cached_torrent_hashes()
+            cached_hashes = await self.database.get_all_cached_torrent_hashes()
             new_hashes = {torrent.hash for torrent in torrents}
 
             # Step 1: Batch delete torrents that no longer exist in client
             torrents_to_delete = cached_hashes - new_hashes
             if torrents_to_delete:
-                await database.delete_client_torrents(torrents_to_delete)
+                await self.database.delete_client_torrents(torrents_to_delete)
                 logger.debug(f"Deleted {len(torrents_to_delete)} torrents from cache")
 
             # Step 2: Update/insert torrents one by one
             for torrent in torrents:
-                await database.save_client_torrent_info(torrent)
+                await self.database.save_client_torrent_info(torrent)
 
             logger.success(f"Synced {len(torrents)} torrents to database cache")
+            await self.database.checkpoint()
 
-        except Exception as e:
+        except SQLAlchemyError as e:
             logger.warning(f"Failed to sync cache: {e}")
 
     async def refresh_client_torrents_cache(self) -> None:
@@ -376,16 +488,14 @@ class TorrentClient(ABC):
         6. Delete torrents that no longer exist in client from database
         """
         try:
-            database = db.get_database()
-
             # Step 1: Get basic info for all torrents (minimal API call)
-            basic_torrents = self.get_torrents(fields=["hash", "name", "download_dir"])
+            basic_torrents = await self.run_blocking(self.get_torrents, fields=["hash", "name", "download_dir"])
             if not basic_torrents:
                 logger.debug("No torrents found in client")
                 return
 
             # Step 2: Get all cached torrents in one query (optimized for batch comparison)
-            cached_torrents = await database.get_all_client_torrents_basic()
+            cached_torrents = await self.database.get_all_client_torrents_basic()
 
             # Step 3: Check which torrents need to be updated
             torrents_to_fetch = [
@@ -400,28 +510,30 @@ class TorrentClient(ABC):
             # Step 4: Fetch modified/new torrents from client API
             if torrents_to_fetch:
                 # Get full info for modified torrents only
-                modified_torrents = self.get_torrents(
+                modified_torrents = await self.run_blocking(
+                    self.get_torrents,
                     torrent_hashes=torrents_to_fetch,
                     fields=["hash", "name", "total_size", "files", "trackers", "download_dir"],
                 )
 
                 # Step 5: Update database
                 if modified_torrents:
-                    await database.batch_save_client_torrents(modified_torrents)
+                    await self.database.batch_save_client_torrents(modified_torrents)
                     logger.debug(f"Updated {len(modified_torrents)} modified torrents in database cache")
             else:
                 logger.debug("No modified torrents found, database cache is up to date")
 
             # Step 6: Delete torrents that no longer exist in client
             if torrents_to_delete:
-                await database.delete_client_torrents(torrents_to_delete)
+                await self.database.delete_client_torrents(torrents_to_delete)
                 logger.debug(f"Deleted {len(torrents_to_delete)} torrents from database cache (removed from client)")
 
         except Exception as e:
             logger.error(f"Error refreshing database cache: {e}")
 
-    @staticmethod
-    async def get_file_matched_torrents(target_file_size: int, fname_keywords: list[str]) -> list[ClientTorrentInfo]:
+    async def get_file_matched_torrents(
+        self, target_file_size: int, fname_keywords: list[str]
+    ) -> list[ClientTorrentInfo]:
         """Get torrents matching file size and name keywords, return ClientTorrentInfo objects.
 
         This is a wrapper around db.search_torrent_by_file_match that processes the raw
@@ -434,12 +546,9 @@ class TorrentClient(ABC):
         Returns:
             List of ClientTorrentInfo objects.
         """
-        database = db.get_database()
-        rows = await database.search_torrent_by_file_match(target_file_size, fname_keywords)
-
         # Group results by torrent hash and build ClientTorrentInfo directly
         torrents_dict = {}
-        for row in rows:
+        async for row in self.database.search_torrent_by_file_match(target_file_size, fname_keywords):
             torrent_hash = row["hash"]
 
             # Initialize ClientTorrentInfo if first time seeing this hash
@@ -449,7 +558,7 @@ class TorrentClient(ABC):
                     name=row["name"],
                     download_dir=row["download_dir"],
                     total_size=row["total_size"],
-                    trackers=msgspec.json.decode(row["trackers"]) if row["trackers"] else [],
+                    trackers=_trackers_decoder.decode(row["trackers"]) if row["trackers"] else [],
                     files=[],
                 )
 
@@ -464,6 +573,125 @@ class TorrentClient(ABC):
 
         return list(torrents_dict.values())
 
+    def _resolve_field_config(self, fields: list[str] | None) -> tuple[dict[str, Any], list[str]]:
+        """Get the field_config subset and client request arguments for the requested fields.
+
+        Callers ask for the same handful of field lists over and over, so the filtered config
+        and the union of its request arguments are computed once per distinct field set.
+
+        Args:
+            fields (list[str] | None): Requested field names, None or empty for all fields.
+
+        Returns:
+            tuple[dict[str, Any], list[str]]: Field config (always including hash) and the
+                request arguments it needs; arguments are empty for plain extractor configs.
+        """
+        key = tuple(sorted(fields)) if fields else None
+        resolved = self._field_config_cache.get(key)
+        if resolved is None:
+            field_config = (
+                {k: v for k, v in self.field_config.items() if k in fields or k == "hash"}
+                if fields
+                else self.field_config
+            )
+            arguments = list(
+                set().union(*[spec.request_arguments for spec in field_config.values() if isinstance(spec, FieldSpec)])
+            )
+            resolved = self._field_config_cache[key] = (field_config, arguments)
+        return resolved
+
+    def _get_torrent_info_builder(self, fields: list[str] | None) -> Callable[[Any], ClientTorrentInfo]:
+        """Get a function building ClientTorrentInfo from a raw client torrent for the requested fields.
+
+        The function is generated once per field set with every extractor bound as a default
+        argument, so building each torrent is a single call without iterating field_config.
+
+        Args:
+            fields (list[str] | None): Requested field names, None or empty for all fields.
+
+        Returns:
+            Callable[[Any], ClientTorrentInfo]: Builder taking the client's torrent object.
+        """
+        key = tuple(sorted(fields)) if fields else None
+        builder = self._info_builders.get(key)
+        if builder is None:
+            field_config, _ = self._resolve_field_config(fields)
+            namespace: dict[str, Any] = {"ClientTorrentInfo": ClientTorrentInfo}
+            for index, spec in enumerate(field_config.values()):
+                namespace[f"_f{index}"] = spec.extractor if isinstance(spec, FieldSpec) else spec
+            params = "".join(f", _f{index}=_f{index}" for index in range(len(field_config)))
+            values = ", ".join(f"{name}=_f{index}(t)" for index, name in enumerate(field_config))
+            exec(f"def build(t{params}):\n    return ClientTorrentInfo({values})\n", namespace)
+            builder = self._info_builders[key] = namespace["build"]
+        return builder
+
+    def _get_tracker_matcher(self, needles: list[str]) -> Callable[[str], tuple[str, ...]]:
+        """Get a matcher returning which of the given substrings a tracker URL contains.
+
+        The same few announce URLs repeat across every torrent of a client, so results are
+        memoized per URL in a bounded LRU cache and matchers are kept per substring list.
+
+        Args:
+            needles (list[str]): Substrings to look for, e.g. target tracker names.
+
+        Returns:
+            Callable[[str], tuple[str, ...]]: Function mapping a tracker URL to the contained substrings.
+        """
+        key = tuple(needles)
+        matcher = self._tracker_matchers.get(key)
+        if matcher is None:
+
+            @functools.lru_cache(maxsize=_TRACKER_MATCH_CACHE_SIZE)
+            def matcher(url: str) -> tuple[str, ...]:
+                return tuple(needle for needle in key if needle in url)
+
+            # Substring lists come from configuration, so only drop old matchers if it keeps changing
+            if len(self._tracker_matchers) >= _MAX_TRACKER_MATCHERS:
+                self._tracker_matchers.clear()
+            self._tracker_matchers[key] = matcher
+        return matcher
+
+    def _get_name_tracker_index(self, ttl: float = 5.0) -> dict[str, list[list[str]]]:
+        """Get torrent name to trackers index, rebuilt from the client at most once per ttl.
+
+        Args:
+            ttl (float): Seconds a built index stays valid.
+
+        Returns:
+            dict[str, list[list[str]]]: Mapping of torrent name to the tracker lists of torrents with that name.
+        """
+        cached = self._name_index_cache
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        generation = self._name_index_generation
+        return self._seed_name_tracker_index(self.get_torrents(fields=["name", "trackers"]), generation)
+
+    def _seed_name_tracker_index(
+        self, torrents: list[ClientTorrentInfo], generation: int
+    ) -> dict[str, list[list[str]]]:
+        """Build the name to trackers index from an already fetched full torrent list.
+
+        Args:
+            torrents (list[ClientTorrentInfo]): All torrents in the client, with name and trackers.
+            generation (int): Value of _name_index_generation before the list was fetched. The index
+                is only cached if nothing was invalidated since, otherwise it is just returned.
+
+        Returns:
+            dict[str, list[list[str]]]: The freshly built index.
+        """
+        index: dict[str, list[list[str]]] = {}
+        for torrent in torrents:
+            index.setdefault(torrent.name, []).append(torrent.trackers)
+        if generation == self._name_index_generation:
+            self._name_index_cache = (time.monotonic(), index)
+        return index
+
+    def _invalidate_name_tracker_index(self) -> None:
+        """Drop the cached name to trackers index after torrents were added, renamed or removed."""
+        self._name_index_generation += 1
+        self._name_index_cache = None
+
     def get_single_torrent(self, infohash: str, target_trackers: list[str]) -> ClientTorrentInfo | None:
         """Get single torrent by infohash with existing trackers information.
 
@@ -494,51 +722,43 @@ class TorrentClient(ABC):
             # Check if torrent meets basic conditions (same as get_filtered_torrents)
             check_trackers_list = config.cfg.global_config.check_trackers
             if check_trackers_list and not any(
-                any(check_str in url for check_str in check_trackers_list) for url in target_torrent.trackers
+                map(self._get_tracker_matcher(check_trackers_list), target_torrent.trackers)
             ):
                 logger.debug(f"Torrent {target_torrent.name} filtered out: tracker not in check_trackers list")
                 logger.debug(f"Torrent trackers: {target_torrent.trackers}")
                 logger.debug(f"Required trackers: {check_trackers_list}")
                 return None
 
-            # Filter MP3 files (based on configuration)
-            if config.cfg.global_config.exclude_mp3:
-                has_mp3 = any(posixpath.splitext(file.name)[1].lower() == ".mp3" for file in target_torrent.files)
-                if has_mp3:
+            exclude_mp3 = config.cfg.global_config.exclude_mp3
+            check_music_only = config.cfg.global_config.check_music_only
+            if exclude_mp3 or check_music_only:
+                has_mp3, has_music = _scan_file_types(target_torrent.files, stop_at_music=not exclude_mp3)
+
+                # Filter MP3 files (based on configuration)
+                if exclude_mp3 and has_mp3:
                     logger.debug(f"Torrent {target_torrent.name} filtered out: contains MP3 files (exclude_mp3=true)")
                     return None
 
-            # Check if torrent contains music files (if check_music_only is enabled)
-            if config.cfg.global_config.check_music_only:
-                has_music = any(filecompare.is_music_file(file.name) for file in target_torrent.files)
-                if not has_music:
+                # Check if torrent contains music files (if check_music_only is enabled)
+                if check_music_only and not has_music:
                     logger.debug(
                         f"Torrent {target_torrent.name} filtered out: no music files found (check_music_only=true)"
                     )
-                    file_extensions = [posixpath.splitext(f.name)[1].lower() for f in target_torrent.files]
+                    file_extensions = [f.ext for f in target_torrent.files]
                     logger.debug(f"File extensions in torrent: {file_extensions}")
                     return None
 
             # Collect which target trackers this content already exists on
             # (by checking all torrents with the same content name)
             existing_trackers = set()
-            for torrent in self.get_torrents(fields=["name", "trackers"]):
-                if torrent.name == target_torrent.name:
-                    for tracker_url in torrent.trackers:
-                        for target_tracker in target_trackers:
-                            if target_tracker in tracker_url:
-                                existing_trackers.add(target_tracker)
-
-            # Return torrent info with existing_trackers
-            return ClientTorrentInfo(
-                hash=target_torrent.hash,
-                name=target_torrent.name,
-                total_size=target_torrent.total_size,
-                files=target_torrent.files,
-                trackers=target_torrent.trackers,
-                download_dir=target_torrent.download_dir,
-                existing_target_trackers=list(existing_trackers),
-            )
+            match_target_trackers = self._get_tracker_matcher(target_trackers)
+            for trackers in self._get_name_tracker_index().get(target_torrent.name, []):
+                for tracker_url in trackers:
+                    existing_trackers.update(match_target_trackers(tracker_url))
+
+            # Return torrent info with existing_trackers, reusing the fetched struct
+            target_torrent.existing_target_trackers = list(existing_trackers)
+            return target_torrent
 
         except Exception as e:
             logger.error("Error retrieving single torrent: %s", e)
@@ -562,10 +782,24 @@ class TorrentClient(ABC):
         """
         try:
             # Get all torrents with required fields
-            torrents = list(
-                self.get_torrents(fields=["hash", "name", "total_size", "files", "trackers", "download_dir"])
+            index_generation = self._name_index_generation
+            torrents: list[ClientTorrentInfo] = await self.run_blocking(
+                self.get_torrents, fields=["hash", "name", "total_size", "files", "trackers", "download_dir"]
             )
 
+            # Names and announce URLs repeat across torrents; intern them so duplicates share one
+            # object and dict lookups below hit the identity fast path. Very long URLs are left
+            # alone to keep one-off strings out of the interned table.
+            intern = sys.intern
+            for torrent in torrents:
+                torrent.name = intern(torrent.name)
+                torrent.trackers = [
+                    intern(url) if len(url) <= _MAX_INTERNED_URL_LENGTH else url for url in torrent.trackers
+                ]
+
+            # Reuse this full pull for single torrent lookups instead of fetching the library again
+            self._seed_name_tracker_index(torrents, index_generation)
+
             # Rebuild cache with all torrents (run in background)
             self.job_manager.scheduler.add_job(
                 self.rebuild_client_torrents_cache_incremental,
@@ -579,25 +813,28 @@ class TorrentClient(ABC):
             # Step 1: Group by content name, collect which trackers each content exists on
             content_tracker_mapping = {}  # {content_name: set(trackers)}
             valid_torrents: dict[str, ClientTorrentInfo] = {}  # Torrents that meet basic conditions
+            valid_keys: dict[str, tuple[int, int]] = {}  # (file_count, total_size) of each kept torrent
+
+            check_trackers_list = config.cfg.global_config.check_trackers
+            match_check_trackers = self._get_tracker_matcher(check_trackers_list) if check_trackers_list else None
+            match_target_trackers = self._get_tracker_matcher(target_trackers)
+            exclude_mp3 = config.cfg.global_config.exclude_mp3
+            check_music_only = config.cfg.global_config.check_music_only
 
             for torrent in torrents:
                 # Only process torrents that meet CHECK_TRACKERS conditions
-                check_trackers_list = config.cfg.global_config.check_trackers
-                if check_trackers_list and not any(
-                    any(check_str in url for check_str in check_trackers_list) for url in torrent.trackers
-                ):
+                if match_check_trackers is not None and not any(map(match_check_trackers, torrent.trackers)):
                     continue
 
-                # Filter MP3 files (based on configuration)
-                if config.cfg.global_config.exclude_mp3:
-                    has_mp3 = any(posixpath.splitext(file.name)[1].lower() == ".mp3" for file in torrent.files)
-                    if has_mp3:
+                if exclude_mp3 or check_music_only:
+                    has_mp3, has_music = _scan_file_types(torrent.files, stop_at_music=not exclude_mp3)
+
+                    # Filter MP3 files (based on configuration)
+                    if exclude_mp3 and has_mp3:
                         continue
 
-                # Check if torrent contains music files (if check_music_only is enabled)
-                if config.cfg.global_config.check_music_only:
-                    has_music = any(filecompare.is_music_file(file.name) for file in torrent.files)
-                    if not has_music:
+                    # Check if torrent contains music files (if check_music_only is enabled)
+                    if check_music_only and not has_music:
                         continue
 
                 content_name = torrent.name
@@ -607,20 +844,14 @@ class TorrentClient(ABC):
                     content_tracker_mapping[content_name] = set()
 
                 for tracker_url in torrent.trackers:
-                    for target_tracker in target_trackers:
-                        if target_tracker in tracker_url:
-                            content_tracker_mapping[content_name].add(target_tracker)
+                    content_tracker_mapping[content_name].update(match_target_trackers(tracker_url))
 
-                # Save torrent info (if duplicated, choose better version)
-                if content_name not in valid_torrents:
+                # Save torrent info (if duplicated, choose version with fewer files or smaller size)
+                key = (len(torrent.files), torrent.total_size)
+                existing_key = valid_keys.get(content_name)
+                if existing_key is None or key < existing_key:
                     valid_torrents[content_name] = torrent
-                else:
-                    # Choose version with fewer files or smaller size
-                    existing = valid_torrents[content_name]
-                    if len(torrent.files) < len(existing.files) or (
-                        len(torrent.files) == len(existing.files) and torrent.total_size < existing.total_size
-                    ):
-                        valid_torrents[content_name] = torrent
+                    valid_keys[content_name] = key
 
             # Step 2: Filter out content that already exists on all target trackers
             filtered_torrents = {}
@@ -634,16 +865,9 @@ class TorrentClient(ABC):
                     logger.debug(f"Skipping {content_name}: already exists on all target trackers {existing_trackers}")
                     continue
 
-                # Otherwise include in results
-                filtered_torrents[content_name] = ClientTorrentInfo(
-                    hash=torrent.hash,
-                    name=content_name,
-                    total_size=torrent.total_size,
-                    files=torrent.files,
-                    trackers=torrent.trackers,
-                    download_dir=torrent.download_dir,
-                    existing_target_trackers=list(existing_trackers),  # Record existing target trackers
-                )
+                # Otherwise include in results, recording existing target trackers on the fetched struct
+                torrent.existing_target_trackers = list(existing_trackers)
+                filtered_torrents[content_name] = torrent
 
             return filtered_torrents
 
@@ -663,16 +887,108 @@ class TorrentClient(ABC):
         try:
             torrent_data = self._get_torrent_data(torrent_hash)
             if torrent_data:
-                return torf.Torrent.read_stream(torrent_data)
+                # Metainfo comes from the client, which already accepted it, so skip validation
+                # here; infohash still validates lazily if a caller needs it
+                return torf.Torrent.read_stream(torrent_data, validate=False)
             return None
         except Exception as e:
             logger.error(f"Error getting torrent object for hash {torrent_hash}: {e}")
             return None
 
+    async def _get_torrent_infos_batched(
+        self, torrent_hashes: Iterable[str], fields: list[str], window: float = 0.01
+    ) -> dict[str, ClientTorrentInfo]:
+        """Get torrent information, coalescing lookups issued within a short window into one RPC.
+
+        Concurrent callers asking for the same fields share a single get_torrents call for the
+        union of their hashes instead of each doing its own round-trip.
+
+        Args:
+            torrent_hashes (Iterable[str]): Torrent hashes to look up.
+            fields (list[str]): Field names to include in the result.
+            window (float): Seconds to wait for other lookups to join the batch.
+
+        Returns:
+            dict[str, ClientTorrentInfo]: Mapping of hash to torrent info for the torrents found.
+        """
+        requested = set(torrent_hashes)
+        key = tuple(dict.fromkeys(["hash", *fields]))
+
+        batch = self._info_batches.get(key)
+        if batch is None:
+            future = asyncio.get_running_loop().create_future()
+            task = asyncio.create_task(self._flush_torrent_info_batch(key, window))
+            batch = self._info_batches[key] = ([], future, task)
+        batch[0].append(requested)
+
+        torrents = await asyncio.shield(batch[1])
+        return {torrent_hash: torrents[torrent_hash] for torrent_hash in requested if torrent_hash in torrents}
+
+    async def _flush_torrent_info_batch(self, key: tuple[str, ...], window: float) -> None:
+        """Fetch one pending torrent info batch and resolve its waiters.
+
+        The batch is only held open for the window when other callers joined it in the
+        same loop iteration, a lone lookup is fetched right away.
+
+        Args:
+            key (tuple[str, ...]): Requested fields identifying the batch.
+            window (float): Seconds to wait for more callers once the batch is shared.
+        """
+        batch = self._info_batches[key]
+        requests, future, _ = batch
+        try:
+            await asyncio.sleep(0)
+            if len(requests) > 1:
+                await asyncio.sleep(window)
+            # Close the batch, later lookups start a new one
+            if self._info_batches.get(key) is batch:
+                del self._info_batches[key]
+            torrents = await self.run_blocking(self.get_torrents, list(set().union(*requests)), list(key))
+        except Exception as e:
+            future.set_exception(e)
+            return
+        except BaseException:
+            # Cancelled (e.g. at shutdown): release waiters instead of leaving them on a future nobody resolves
+            if self._info_batches.get(key) is batch:
+                del self._info_batches[key]
+            future.cancel()
+            raise
+        future.set_result({torrent.hash: torrent for torrent in torrents})
+
     # endregion
 
     # region Torrent Injection
 
+    def _wait_for_torrent_name(
+        self, torrent_hash: str, expected_name: str, timeout: float = 1.0, min_wait: float = 0.0
+    ) -> bool:
+        """Poll the client until a torrent reports the expected name, backing off between polls.
+
+        Args:
+            torrent_hash (str): Torrent hash.
+            expected_name (str): Name the torrent should have after renaming.
+            timeout (float): Maximum seconds to wait.
+            min_wait (float): Minimum seconds to wait even if the name is observed earlier, giving the
+                client time to apply file renames that can't be polled the same way on every client.
+
+        Returns:
+            bool: True if the name was observed before the timeout, False otherwise.
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        delay = 0.05
+        while True:
+            torrent_info = self.get_torrent_info(torrent_hash, ["name"])
+            if torrent_info is not None and torrent_info.name == expected_name:
+                if (remaining := start + min_wait - time.monotonic()) > 0:
+                    time.sleep(remaining)
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay *= 2
+
     def inject_torrent(
         self, torrent_data, download_dir: str, local_torrent_name: str, rename_map: dict, hash_match: bool
     ) -> tuple[bool, bool]:
@@ -695,7 +1011,8 @@ class TorrentClient(ABC):
         # Flag to track if rename map has been processed
         rename_map_processed = False
 
-        current_name = str(torf.Torrent.read_stream(torrent_data).name)
+        # Only the name is needed here, the client validates the torrent when it is added
+        current_name = str(torf.Torrent.read_stream(torrent_data, validate=False).name)
         name_differs = current_name != local_torrent_name
 
         if self.__class__.__name__ == "RTorrentClient":
@@ -716,6 +1033,7 @@ class TorrentClient(ABC):
         # Add torrent to client
         try:
             torrent_hash = self._add_torrent(torrent_data, download_dir, hash_match)
+            self._invalidate_name_tracker_index()
         except TorrentConflictError as e:
             logger.error(f"Torrent injection failed due to conflict: {e}")
             logger.error(
@@ -758,7 +1076,8 @@ class TorrentClient(ABC):
                 )
                 if should_verify:
                     logger.debug("Verifying torrent after renaming")
-                    time.sleep(1)
+                    # File renames are not polled, keep the full second the client used to get to apply them
+                    self._wait_for_torrent_name(torrent_hash, local_torrent_name, min_wait=1.0 if rename_map else 0.0)
                     self._verify_torrent(torrent_hash)
 
                 logger.success("Torrent injected successfully")
@@ -766,7 +1085,8 @@ class TorrentClient(ABC):
             except Exception as e:
                 if attempt < max_retries - 1:
                     logger.debug(f"Error injecting torrent: {e}, retrying ({attempt + 1}/{max_retries})...")
-                    time.sleep(2)
+                    # Exponential backoff capped at 2 seconds, jittered so retries don't hit the client in lockstep
+                    time.sleep(min(0.1 * 2**attempt, 2.0) + random.random() * 0.1)
                 else:
                     logger.error(f"Failed to inject torrent after {max_retries} attempts: {e}")
                     return False, False
@@ -774,6 +1094,25 @@ class TorrentClient(ABC):
         # This should never be reached, but just in case
         return False, False
 
+    async def inject_torrent_async(
+        self, torrent_data, download_dir: str, local_torrent_name: str, rename_map: dict, hash_match: bool
+    ) -> tuple[bool, bool]:
+        """Inject torrent into client on the RPC thread, see inject_torrent.
+
+        Args:
+            torrent_data: Torrent file data.
+            download_dir (str): Download directory.
+            local_torrent_name (str): Local torrent name.
+            rename_map (dict): File rename mapping.
+            hash_match (bool): Whether this is a hash match, if True, skip verification.
+
+        Returns:
+            tuple[bool, bool]: (success, verified), same as inject_torrent.
+        """
+        return await self.run_blocking(
+            self.inject_torrent, torrent_data, download_dir, local_torrent_name, rename_map, hash_match
+        )
+
     def reverse_inject_torrent(
         self, matched_torrents: list[ClientTorrentInfo], new_name: str, reverse_rename_map: dict
     ) -> dict[str, bool]:
@@ -789,11 +1128,17 @@ class TorrentClient(ABC):
         """
         results = {}
 
+        # Get current torrent names in one request instead of one per torrent
+        current_torrents = {
+            torrent.hash: torrent
+            for torrent in self.get_torrents([torrent.hash for torrent in matched_torrents], ["hash", "name"])
+        }
+
         for matched_torrent in matched_torrents:
             torrent_hash = matched_torrent.hash
             try:
                 # Get current torrent name
-                torrent_info = self.get_torrent_info(torrent_hash, ["name"])
+                torrent_info = current_torrents.get(torrent_hash)
                 if torrent_info is None or torrent_info.name is None:
                     logger.warning(f"Failed to get torrent info for {torrent_hash}, skipping")
                     continue
@@ -802,6 +1147,7 @@ class TorrentClient(ABC):
                 # Rename entire torrent
                 if current_name != new_name:
                     self._rename_torrent(torrent_hash, current_name, new_name)
+                    self._invalidate_name_tracker_index()
                     logger.debug(f"Renamed torrent {torrent_hash} from {current_name} to {new_name}")
 
                 # Rename files according to reverse rename map
@@ -843,75 +1189,126 @@ class TorrentClient(ABC):
         Returns:
             PostProcessResult: Processing result with status, started_downloading flag, and error_message
         """
-        result = PostProcessResult()
+        results = await self.post_process_injected_torrents([matched_torrent_hash])
+        return results[matched_torrent_hash]
 
-        try:
-            database = db.get_database()
+    async def post_process_injected_torrents(self, matched_torrent_hashes: list[str]) -> dict[str, PostProcessResult]:
+        """Post-process injected torrents with one client lookup and one checked-status update.
 
-            logger.debug(f"Checking matched torrent: {matched_torrent_hash}")
+        Args:
+            matched_torrent_hashes: Hashes of the matched torrents to process
 
-            # Check if matched torrent exists in client
-            matched_torrent = self.get_torrent_info(
-                matched_torrent_hash, ["state", "name", "progress", "files", "piece_progress"]
+        Returns:
+            dict[str, PostProcessResult]: Processing result for each hash
+        """
+        results = {matched_torrent_hash: PostProcessResult() for matched_torrent_hash in matched_torrent_hashes}
+        if not results:
+            return results
+
+        try:
+            # Check if matched torrents exist in client, sharing the RPC with concurrent lookups
+            matched_torrents = await self._get_torrent_infos_batched(
+                results.keys(), ["state", "name", "progress", "files", "piece_progress"]
             )
-            if not matched_torrent:
-                logger.debug(f"Matched torrent {matched_torrent_hash} not found in client, skipping")
-                result.status = "not_found"
-                return result
-
-            # Skip if matched torrent is checking
-            if matched_torrent.state == TorrentState.CHECKING:
-                logger.debug(f"Matched torrent {matched_torrent.name} is checking, skipping")
-                result.status = "checking"
-                return result
-
-            # If matched torrent is 100% complete, start downloading
-            if matched_torrent.progress == 1.0:
-                logger.info(f"Matched torrent {matched_torrent.name} is 100% complete")
-                # Check if auto-start is enabled
-                if config.cfg.global_config.auto_start_torrents:
-                    # Start downloading the matched torrent
-                    self._resume_torrent(matched_torrent.hash)
-                    logger.success(f"Started downloading matched torrent: {matched_torrent.name}")
-                    result.started_downloading = True
-                else:
-                    logger.info("Auto-start disabled, torrent will remain paused")
-                    result.started_downloading = False
-                # Mark as checked since it's 100% complete
-                await database.update_scan_result_checked(matched_torrent_hash, True)
-                result.status = "completed"
-            # If matched torrent is not 100% complete, check file progress patterns
-            else:
-                logger.debug(
-                    f"Matched torrent {matched_torrent.name} not 100% complete "
-                    f"({matched_torrent.progress * 100:.1f}%), checking file patterns"
+        except Exception as e:
+            logger.error(f"Error retrieving matched torrents: {e}")
+            for result in results.values():
+                result.status = "error"
+                result.error_message = str(e)
+            return results
+
+        # Hashes to mark as checked, written in a single transaction at the end
+        checked_hashes: list[str] = []
+        for matched_torrent_hash, result in results.items():
+            try:
+                await self._post_process_injected_torrent(
+                    matched_torrent_hash, matched_torrents.get(matched_torrent_hash), result, checked_hashes
                 )
+            except Exception as e:
+                logger.error(f"Error processing torrent {matched_torrent_hash}: {e}")
+                result.status = "error"
+                result.error_message = str(e)
 
-                # Analyze file progress patterns
-                if filecompare.should_keep_partial_torrent(matched_torrent):
-                    logger.debug(f"Keeping partial torrent {matched_torrent.name} - valid pattern")
-                    # Mark as checked since we're keeping the partial torrent
-                    await database.update_scan_result_checked(matched_torrent_hash, True)
-                    result.status = "partial_kept"
-                else:
-                    if config.cfg.linking.link_type in ["reflink", "reflink_or_copy"]:
-                        # Keep partial torrent explicitly due to reflink being enabled
-                        logger.info(f"Keeping partial torrent {matched_torrent.name} - kept due to reflink enabled")
-                        await database.update_scan_result_checked(matched_torrent_hash, True)
-                        result.status = "partial_kept"
-                    else:
-                        logger.warning(f"Removing torrent {matched_torrent.name} - failed validation")
-                        self._remove_torrent(matched_torrent.hash)
-                        # Clear matched torrent information from database
-                        await database.clear_matched_torrent_info(matched_torrent_hash)
-                        result.status = "partial_removed"
-
+        try:
+            await self.database.update_scan_results_checked(checked_hashes, True)
         except Exception as e:
-            logger.error(f"Error processing torrent {matched_torrent_hash}: {e}")
-            result.status = "error"
-            result.error_message = str(e)
+            logger.error(f"Error marking {len(checked_hashes)} matched torrents as checked: {e}")
+            # Not recorded as checked, so they must not be counted as settled
+            for matched_torrent_hash in checked_hashes:
+                result = results[matched_torrent_hash]
+                result.status = "error"
+                result.error_message = str(e)
 
-        return result
+        return results
+
+    async def _post_process_injected_torrent(
+        self,
+        matched_torrent_hash: str,
+        matched_torrent: ClientTorrentInfo | None,
+        result: PostProcessResult,
+        checked_hashes: list[str],
+    ) -> None:
+        """Decide what to do with one injected torrent and record the outcome in result.
+
+        Args:
+            matched_torrent_hash: The hash of the matched torrent
+            matched_torrent: Torrent info from the client, or None if it was not found
+            result: Result to fill in
+            checked_hashes: Hashes to mark as checked, appended to when the torrent is settled
+        """
+        logger.debug(f"Checking matched torrent: {matched_torrent_hash}")
+
+        if not matched_torrent:
+            logger.debug(f"Matched torrent {matched_torrent_hash} not found in client, skipping")
+            result.status = "not_found"
+            return
+
+        # Skip if matched torrent is checking
+        if matched_torrent.state == TorrentState.CHECKING:
+            logger.debug(f"Matched torrent {matched_torrent.name} is checking, skipping")
+            result.status = "checking"
+            return
+
+        # If matched torrent is 100% complete, start downloading
+        if matched_torrent.progress == 1.0:
+            logger.info(f"Matched torrent {matched_torrent.name} is 100% complete")
+            # Check if auto-start is enabled
+            if config.cfg.global_config.auto_start_torrents:
+                # Start downloading the matched torrent
+                await self.run_blocking(self._resume_torrent, matched_torrent.hash)
+                logger.success(f"Started downloading matched torrent: {matched_torrent.name}")
+                result.started_downloading = True
+            else:
+                logger.info("Auto-start disabled, torrent will remain paused")
+                result.started_downloading = False
+            # Mark as checked since it's 100% complete
+            checked_hashes.append(matched_torrent_hash)
+            result.status = "completed"
+        # If matched torrent is not 100% complete, check file progress patterns
+        else:
+            logger.debug(
+                f"Matched torrent {matched_torrent.name} not 100% complete "
+                f"({matched_torrent.progress * 100:.1f}%), checking file patterns"
+            )
+
+            # Analyze file progress patterns
+            if filecompare.should_keep_partial_torrent(matched_torrent):
+                logger.debug(f"Keeping partial torrent {matched_torrent.name} - valid pattern")
+                # Mark as checked since we're keeping the partial torrent
+                checked_hashes.append(matched_torrent_hash)
+                result.status = "partial_kept"
+            elif config.cfg.linking.link_type in ["reflink", "reflink_or_copy"]:
+                # Keep partial torrent explicitly due to reflink being enabled
+                logger.info(f"Keeping partial torrent {matched_torrent.name} - kept due to reflink enabled")
+                checked_hashes.append(matched_torrent_hash)
+                result.status = "partial_kept"
+            else:
+                logger.warning(f"Removing torrent {matched_torrent.name} - failed validation")
+                await self.run_blocking(self._remove_torrent, matched_torrent.hash)
+                self._invalidate_name_tracker_index()
+                # Clear matched torrent information from database
+                await self.database.clear_matched_torrent_info(matched_torrent_hash)
+                result.status = "partial_removed"
 
     # endregion
 
@@ -922,26 +1319,83 @@ class TorrentClient(ABC):
         if not self.monitoring:
             self.monitoring = True
 
-            # Add scheduled job for monitoring to the global scheduler
-            self.job_manager.scheduler.add_job(
-                self._check_tracked_torrents,
-                trigger=IntervalTrigger(seconds=1),
-                id=self._monitor_job_id,
-                name="Torrent Monitor",
-                max_instances=1,  # Prevent overlapping executions
-                misfire_grace_time=60,
-                coalesce=True,
-                replace_existing=True,
-            )
+            # Reuse a loop that is still draining, otherwise start a new one
+            if self._monitor_task is None or self._monitor_task.done():
+                self._monitor_task = asyncio.create_task(self._monitor_loop(), name="nemorosa-torrent-monitor")
 
             logger.info("Torrent monitoring started")
 
+    async def _monitor_loop(self) -> None:
+        """Poll the client only while torrents are verifying, otherwise sleep until woken.
+
+        The loop waits on the state change event, which is set whenever a tracked torrent is
+        promoted to verifying or tracking is stopped, so an idle monitor costs no client RPCs.
+        While verifications run, the poll interval doubles from the minimum up to the maximum
+        as long as nothing completes, and drops back to the minimum on any change.
+        It exits once monitoring is stopped and nothing is tracked anymore.
+        """
+        interval = self._monitor_min_poll_interval
+        while self.monitoring or self._tracked_torrents:
+            activated, next_activation = self._activate_due_torrents()
+            if activated:
+                interval = self._monitor_min_poll_interval
+
+            timeout = None
+            if any(self._tracked_torrents.values()):
+                tracked_count = len(self._tracked_torrents)
+                await self._check_tracked_torrents()
+                if not self.monitoring and not self._tracked_torrents:
+                    break
+                if len(self._tracked_torrents) < tracked_count:
+                    interval = self._monitor_min_poll_interval
+                else:
+                    interval = min(interval * 2, self._monitor_max_poll_interval)
+                timeout = interval + random.random() * 0.1
+
+            # Also wake up when the next delayed torrent is due
+            if next_activation is not None:
+                timeout = next_activation if timeout is None else min(timeout, next_activation)
+
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._state_change_event.wait(), timeout=timeout)
+            if self._state_change_event.is_set():
+                # A torrent started verifying or tracking changed, check again soon
+                interval = self._monitor_min_poll_interval
+                self._state_change_event.clear()
+
+        logger.debug("Torrent monitor loop exited")
+
+    def _activate_due_torrents(self) -> tuple[bool, float | None]:
+        """Promote delayed torrents whose start delay has passed to verifying.
+
+        Returns:
+            tuple[bool, float | None]: Whether any torrent was promoted, and seconds until the
+                next pending deadline (None if nothing is pending).
+        """
+        pending = self._pending_activations
+        now = time.monotonic()
+        activated = False
+        while pending and pending[0][0] <= now:
+            deadline, torrent_hash = heapq.heappop(pending)
+            # Skip entries superseded by a later registration or torrents no longer tracked
+            if self._activation_deadlines.get(torrent_hash) != deadline:
+                continue
+            del self._activation_deadlines[torrent_hash]
+            if torrent_hash in self._tracked_torrents:
+                # Update status to verifying (True)
+                self._tracked_torrents[torrent_hash] = True
+                activated = True
+                logger.debug(f"Started tracking verification for torrent {torrent_hash}")
+        return activated, (pending[0][0] - now if pending else None)
+
     async def wait_for_monitoring_completion(self) -> None:
         """Wait for monitoring to complete and all tracked torrents to finish processing."""
         if not self.monitoring:
             return
 
         self.monitoring = False
+        # Let an idle monitor loop notice that it should exit
+        self._state_change_event.set()
 
         # Wait for all tracked torrents to be processed
         if self._tracked_torrents:
@@ -967,7 +1421,7 @@ class TorrentClient(ABC):
     async def _check_tracked_torrents(self) -> None:
         """Check tracked torrents for verification completion.
 
-        This method is called by APScheduler at regular intervals.
+        This method is called by the monitor loop while torrents are verifying.
         """
         if not self._tracked_torrents:
             return
@@ -979,99 +1433,73 @@ class TorrentClient(ABC):
                 return
 
             # Get current torrent states using optimized monitoring method
-            current_states = self.get_torrents_for_monitoring(verifying_torrents)
-            completed_torrents = set()
-
-            for torrent_hash in self._tracked_torrents:
-                current_state = current_states.get(torrent_hash)
-
-                # Check if verification is no longer in progress
-                # (not checking, allocating, or moving)
-                if current_state in [
-                    TorrentState.PAUSED,
-                    TorrentState.COMPLETED,
-                    TorrentState.SEEDING,
-                ]:
+            current_states = await self.run_blocking(self.get_torrents_for_monitoring, verifying_torrents)
+
+            # Check if verification is no longer in progress (not checking, allocating, or moving)
+            completed_torrents = [
+                torrent_hash
+                for torrent_hash in self._tracked_torrents
+                if current_states.get(torrent_hash) in _VERIFICATION_DONE_STATES
+            ]
+
+            if completed_torrents:
+                for torrent_hash in completed_torrents:
                     logger.info(f"Verification completed for torrent {torrent_hash}")
 
-                    # Call post_process_single_injected_torrent from torrent client
-                    try:
-                        await self.post_process_single_injected_torrent(torrent_hash)
-                    except Exception as e:
-                        logger.error(f"Error processing torrent {torrent_hash}: {e}")
+                # Post-process all completed torrents with one client lookup and one database update
+                try:
+                    await self.post_process_injected_torrents(completed_torrents)
+                except Exception as e:
+                    logger.error(f"Error processing torrents {completed_torrents}: {e}")
 
-                    # Remove from tracking
-                    completed_torrents.add(torrent_hash)
+            # Remove completed torrents from tracking
+            for torrent_hash in completed_torrents:
+                self._tracked_torrents.pop(torrent_hash, None)
 
-            # Check tracked torrents for completion
-            with self._monitor_lock:
-                # Remove completed torrents from tracking
-                for torrent_hash in completed_torrents:
-                    self._tracked_torrents.pop(torrent_hash, None)
-
-                # If no more tracked torrents, set the event
-                if not self._tracked_torrents:
-                    self._torrents_processed_event.set()
-                    self.monitoring = False
-                    # Remove the job from the global scheduler
-                    try:
-                        self.job_manager.scheduler.remove_job(self._monitor_job_id)
-                        logger.info("Torrent monitoring stopped")
-                    except Exception as e:
-                        logger.warning(f"Error removing torrent monitor job: {e}")
+            # If no more tracked torrents, set the event and let the monitor loop exit
+            if not self._tracked_torrents:
+                self._torrents_processed_event.set()
+                self.monitoring = False
+                logger.info("Torrent monitoring stopped")
 
         except Exception as e:
             logger.error(f"Error checking tracked torrents: {e}")
 
     async def track_verification(self, torrent_hash: str) -> None:
-        """Start tracking a torrent for verification completion."""
-        with self._monitor_lock:
-            # Lazy start monitoring if not already started
-            if not self.monitoring:
-                await self.start_monitoring()
-
-            # Add to tracked torrents as delayed (False)
-            self._tracked_torrents[torrent_hash] = False
-
-        # Start a background task to add torrent after 5 seconds delay
-        self.job_manager.scheduler.add_job(
-            self._delayed_add_torrent,
-            trigger=DateTrigger(run_date=datetime.now(UTC) + timedelta(seconds=5)),
-            args=[torrent_hash],
-            id=f"delayed_add_{torrent_hash}",
-            replace_existing=True,
-        )
-        logger.debug(f"Scheduled tracking verification for torrent {torrent_hash}")
-
-    async def _delayed_add_torrent(self, torrent_hash: str) -> None:
-        """Add torrent to tracking list after 5 seconds delay.
+        """Start tracking a torrent for verification completion.
 
-        Note: The 5-second delay is necessary for qBittorrent. After calling
-        self._verify_torrent(torrent_hash), qBittorrent doesn't immediately start verification.
-        It needs processing time to begin the actual verification process, and this processing
-        time cannot be queried. The delay is now handled by APScheduler's DateTrigger.
+        Note: The torrent is only polled after a 5-second delay, which is necessary for qBittorrent.
+        After calling self._verify_torrent(torrent_hash), qBittorrent doesn't immediately start
+        verification. It needs processing time to begin the actual verification process, and this
+        processing time cannot be queried.
         """
-        with self._monitor_lock:
-            # Update status to verifying (True)
-            if torrent_hash in self._tracked_torrents:
-                self._tracked_torrents[torrent_hash] = True
-                logger.debug(f"Started tracking verification for torrent {torrent_hash}")
+        # Lazy start monitoring if not already started
+        if not self.monitoring:
+            await self.start_monitoring()
+
+        # Add to tracked torrents as delayed (False)
+        self._tracked_torrents[torrent_hash] = False
+
+        # Promote to verifying after the start delay, handled by the monitor loop
+        deadline = time.monotonic() + self._verification_start_delay
+        self._activation_deadlines[torrent_hash] = deadline
+        heapq.heappush(self._pending_activations, (deadline, torrent_hash))
+        self._state_change_event.set()
+        logger.debug(f"Scheduled tracking verification for torrent {torrent_hash}")
 
     def stop_tracking(self, torrent_hash: str) -> None:
         """Stop tracking a torrent."""
-        with self._monitor_lock:
-            self._tracked_torrents.pop(torrent_hash, None)
-            logger.debug(f"Stopped tracking torrent {torrent_hash}")
+        self._tracked_torrents.pop(torrent_hash, None)
+        self._state_change_event.set()
+        logger.debug(f"Stopped tracking torrent {torrent_hash}")
 
     def is_tracking(self, torrent_hash: str) -> bool:
         """Check if a torrent is being tracked."""
-        with self._monitor_lock:
-            return torrent_hash in self._tracked_torrents
+        return torrent_hash in self._tracked_torrents
 
     def get_tracked_count(self) -> int:
         """Get the number of torrents being tracked."""
-        with self._monitor_lock:
-            return len(self._tracked_torrents)
+        return len(self._tracked_torrents)
 
     # endregion
 
@@ -32,6 +32,9 @@ DELUGE_STATE_MAPPING = {
     "Inactive": TorrentState.PAUSED,
 }
 
+# Maps piece state values to 1 for downloaded pieces (3) and 0 otherwise, for bytes.translate
+_PIECE_DOWNLOADED_TABLE = bytes(int(state == 3) for state in range(256))
+
 # Field specifications for Deluge torrent client
 _DELUGE_FIELD_SPECS = {
     "hash": FieldSpec(_request_arguments="hash", extractor=lambda t: t["hash"]),
@@ -56,7 +59,9 @@ _DELUGE_FIELD_SPECS = {
     "piece_progress": FieldSpec(
         _request_arguments={"pieces", "num_pieces"},
         extractor=lambda t: (
-            [True] * t["num_pieces"] if t["progress"] == 100.0 else [piece == 3 for piece in t["pieces"]]
+            b"\x01" * t["num_pieces"]
+            if t["progress"] == 100.0
+            else bytes(t["pieces"]).translate(_PIECE_DOWNLOADED_TABLE)
         ),
     ),
 }
@@ -99,15 +104,8 @@ class DelugeClient(TorrentClient):
             list[ClientTorrentInfo]: List of torrent information.
         """
         try:
-            # Get requested fields (always include hash)
-            field_config = (
-                {k: v for k, v in self.field_config.items() if k in fields or k == "hash"}
-                if fields
-                else self.field_config
-            )
-
-            # Get required Deluge properties based on requested fields
-            arguments = list(set().union(*[spec.request_arguments for spec in field_config.values()]))
+            # Get client properties needed for the requested fields
+            _, arguments = self._resolve_field_config(fields)
 
             # Get torrents from Deluge (filtered by hashes if provided)
             torrent_details = self.client.call(
@@ -118,13 +116,8 @@ class DelugeClient(TorrentClient):
                 return []
 
             # Build ClientTorrentInfo objects
-            result = []
-            for torrent in torrent_details.values():
-                values = {field_name: spec.extractor(torrent) for field_name, spec in field_config.items()}
-                torrent_info = ClientTorrentInfo(**values)
-                result.append(torrent_info)
-
-            return result
+            build = self._get_torrent_info_builder(fields)
+            return [build(torrent) for torrent in torrent_details.values()]
 
         except Exception as e:
             logger.error("Error retrieving torrents from Deluge: %s", e)
@@ -155,8 +148,10 @@ class DelugeClient(TorrentClient):
 
             result = {}
             if torrents_status and isinstance(torrents_status, dict):
+                state_get = DELUGE_STATE_MAPPING.get
+                unknown = TorrentState.UNKNOWN
                 result = {
-                    torrent_hash: DELUGE_STATE_MAPPING.get(status.get("state"), TorrentState.UNKNOWN)
+                    torrent_hash: state_get(status.get("state"), unknown)
                     for torrent_hash, status in torrents_status.items()
                 }
 
@@ -169,15 +164,8 @@ class DelugeClient(TorrentClient):
     def get_torrent_info(self, torrent_hash: str, fields: list[str] | None) -> ClientTorrentInfo | None:
         """Get torrent information."""
         try:
-            # Get requested fields (always include hash)
-            field_config = (
-                {k: v for k, v in self.field_config.items() if k in fields or k == "hash"}
-                if fields
-                else self.field_config
-            )
-
-            # Get required arguments from field_config
-            arguments = list(set().union(*[spec.request_arguments for spec in field_config.values()]))
+            # Get client properties needed for the requested fields
+            _, arguments = self._resolve_field_config(fields)
 
             torrent_info = self.client.call(
                 "core.get_torrent_status",
@@ -188,10 +176,8 @@ class DelugeClient(TorrentClient):
             if torrent_info is None:
                 return None
 
-            # Build ClientTorrentInfo using field_config
-            return ClientTorrentInfo(
-                **{field_name: spec.extractor(torrent_info) for field_name, spec in field_config.items()}
-            )
+            # Build ClientTorrentInfo for the requested fields
+            return self._get_torrent_info_builder(fields)(torrent_info)
         except Exception as e:
             logger.error("Error retrieving torrent info from Deluge: %s", e)
             return None
@@ -1,4 +1,5 @@
 import posixpath
+import threading
 import time
 
 import qbittorrentapi
@@ -40,6 +41,9 @@ QBITTORRENT_STATE_MAPPING = {
     "unknown": TorrentState.UNKNOWN,
 }
 
+# Maps piece state values to 1 for downloaded pieces (2) and 0 otherwise, for bytes.translate
+_PIECE_DOWNLOADED_TABLE = bytes(int(state == 2) for state in range(256))
+
 # Field extractors for qBittorrent torrent client
 _QBITTORRENT_FIELD_SPECS = {
     "hash": lambda t: t.hash,
@@ -52,7 +56,7 @@ _QBITTORRENT_FIELD_SPECS = {
     else [tracker.url for tracker in t.trackers if tracker.url not in ("** [DHT] **", "** [PeX] **", "** [LSD] **")],
     "download_dir": lambda t: t.save_path,
     "state": lambda t: QBITTORRENT_STATE_MAPPING.get(t.state, TorrentState.UNKNOWN),
-    "piece_progress": lambda t: [piece == 2 for piece in t.pieceStates] if t.pieceStates else [],
+    "piece_progress": lambda t: bytes(t.pieceStates).translate(_PIECE_DOWNLOADED_TABLE) if t.pieceStates else b"",
 }
 
 
@@ -74,6 +78,10 @@ class QBittorrentClient(TorrentClient):
         # Initialize sync state for incremental updates
         self._last_rid = 0
         self._torrent_states_cache: dict[str, TorrentState] = {}
+        # Sync responses are reused for this long, so close calls share one HTTP request
+        self._sync_max_age = 0.25
+        self._sync_synced_at = 0.0
+        self._sync_lock = threading.Lock()
 
         # Use the field specifications constant
         self.field_config = _QBITTORRENT_FIELD_SPECS
@@ -95,24 +103,12 @@ class QBittorrentClient(TorrentClient):
             list[ClientTorrentInfo]: List of torrent information.
         """
         try:
-            # Get requested fields (always include hash)
-            field_config = (
-                {k: v for k, v in self.field_config.items() if k in fields or k == "hash"}
-                if fields
-                else self.field_config
-            )
-
             # Get torrents from qBittorrent
             torrents = self.client.torrents_info(torrent_hashes=torrent_hashes)
 
             # Build ClientTorrentInfo objects
-            result = []
-            for torrent in torrents:
-                values = {field_name: extractor(torrent) for field_name, extractor in field_config.items()}
-                torrent_info = ClientTorrentInfo(**values)
-                result.append(torrent_info)
-
-            return result
+            build = self._get_torrent_info_builder(fields)
+            return [build(torrent) for torrent in torrents]
 
         except Exception as e:
             logger.error("Error retrieving torrents from qBittorrent: %s", e)
@@ -127,17 +123,8 @@ class QBittorrentClient(TorrentClient):
 
             torrent = torrent_info[0]
 
-            # Get requested fields (always include hash)
-            field_config = (
-                {k: v for k, v in self.field_config.items() if k in fields or k == "hash"}
-                if fields
-                else self.field_config
-            )
-
-            # Build ClientTorrentInfo using field_config
-            return ClientTorrentInfo(
-                **{field_name: extractor(torrent) for field_name, extractor in field_config.items()}
-            )
+            # Build ClientTorrentInfo for the requested fields
+            return self._get_torrent_info_builder(fields)(torrent)
         except Exception as e:
             logger.error("Error retrieving torrent info from qBittorrent: %s", e)
             return None
@@ -158,6 +145,22 @@ class QBittorrentClient(TorrentClient):
         if not torrent_hashes:
             return {}
 
+        # Fast path: serve recent sync data without another round-trip
+        if time.monotonic() - self._sync_synced_at < self._sync_max_age:
+            return self._torrent_states_cache
+
+        with self._sync_lock:
+            # Another caller may have synced while we waited for the lock
+            if time.monotonic() - self._sync_synced_at < self._sync_max_age:
+                return self._torrent_states_cache
+            return self._sync_torrent_states()
+
+    def _sync_torrent_states(self) -> dict[str, TorrentState]:
+        """Apply one incremental sync/maindata response to the torrent states cache.
+
+        Returns:
+            dict[str, TorrentState]: The updated torrent states cache.
+        """
         try:
             # Use qBittorrent's sync API for efficient monitoring
             # This returns only changed data since last request using RID
@@ -177,12 +180,15 @@ class QBittorrentClient(TorrentClient):
                 return {}
 
             # Update cache with new data from torrents_data
+            state_get = QBITTORRENT_STATE_MAPPING.get
+            unknown = TorrentState.UNKNOWN
+            states_cache = self._torrent_states_cache
             for torrent_hash, torrent_info in torrents_data.items():
                 if isinstance(torrent_info, dict):
                     state_str = torrent_info.get("state", "unknown")
                     if isinstance(state_str, str):
-                        state = QBITTORRENT_STATE_MAPPING.get(state_str, TorrentState.UNKNOWN)
-                        self._torrent_states_cache[torrent_hash] = state
+                        states_cache[torrent_hash] = state_get(state_str, unknown)
+            self._sync_synced_at = time.monotonic()
 
             # Return cached states for requested torrents
             return self._torrent_states_cache
@@ -200,7 +206,8 @@ class QBittorrentClient(TorrentClient):
         """Add torrent to qBittorrent."""
 
         # qBittorrent doesn't return the hash directly, we need to decode it
-        torrent_obj = torf.Torrent.read_stream(torrent_data)
+        # (infohash validates the metainfo itself, so skip the eager validation pass)
+        torrent_obj = torf.Torrent.read_stream(torrent_data, validate=False)
         info_hash = torrent_obj.infohash
 
         current_time = time.time()
@@ -301,6 +308,7 @@ class QBittorrentClient(TorrentClient):
         """
         self._last_rid = 0
         self._torrent_states_cache.clear()
+        self._sync_synced_at = 0.0
         logger.debug("Reset qBittorrent sync state")
 
     # endregion
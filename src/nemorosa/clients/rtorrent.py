@@ -78,7 +78,7 @@ _RTORRENT_FIELD_SPECS = {
 }
 
 
-def _decode_bitfield(bitfield_hex: str, piece_count: int, progress: float = 0.0) -> list[bool]:
+def _decode_bitfield(bitfield_hex: str, piece_count: int, progress: float = 0.0) -> bytes:
     """Decode hexadecimal bitfield data to get piece download status.
 
     Args:
@@ -87,13 +87,13 @@ def _decode_bitfield(bitfield_hex: str, piece_count: int, progress: float = 0.0)
         progress: Download progress (0.0 to 1.0)
 
     Returns:
-        List of boolean values indicating piece download status
+        One byte per piece, 1 if the piece has been downloaded and 0 otherwise
     """
     if progress == 1.0:
-        return [True] * piece_count
+        return b"\x01" * piece_count
 
     if not bitfield_hex:
-        return [False] * piece_count
+        return bytes(piece_count)
 
     bitfield_data = bytes.fromhex(bitfield_hex)
     return decode_bitfield_bytes(bitfield_data, piece_count)
@@ -155,15 +155,8 @@ class RTorrentClient(TorrentClient):
             list[ClientTorrentInfo]: List of torrent information.
         """
         try:
-            # Get requested fields (always include hash)
-            field_config = (
-                {k: v for k, v in self.field_config.items() if k in fields or k == "hash"}
-                if fields
-                else self.field_config
-            )
-
-            # Build rTorrent multicall arguments
-            arguments = list(set().union(*[spec.request_arguments for spec in field_config.values()]))
+            # Get requested fields (always include hash) and the client properties they need
+            field_config, arguments = self._resolve_field_config(fields)
 
             if torrent_hashes:
                 # If specific hashes are requested, use xmlrpc.client's MultiCall
@@ -271,15 +264,8 @@ class RTorrentClient(TorrentClient):
     def get_torrent_info(self, torrent_hash: str, fields: list[str] | None) -> ClientTorrentInfo | None:
         """Get torrent information."""
         try:
-            # Get requested fields (always include hash)
-            field_config = (
-                {k: v for k, v in self.field_config.items() if k in fields or k == "hash"}
-                if fields
-                else self.field_config
-            )
-
-            # Build rTorrent multicall arguments
-            arguments = list(set().union(*[spec.request_arguments for spec in field_config.values()]))
+            # Get requested fields (always include hash) and the client properties they need
+            field_config, arguments = self._resolve_field_config(fields)
 
             # Use xmlrpc.client's MultiCall for single torrent info
             multicall = xmlrpc.client.MultiCall(self.client)
@@ -383,8 +369,8 @@ class RTorrentClient(TorrentClient):
 
     def _add_torrent(self, torrent_data, download_dir: str, hash_match: bool) -> str:
         """Add torrent to rTorrent with optional fast resume support."""
-        # Parse torrent to get hash and info
-        torrent_obj = torf.Torrent.read_stream(torrent_data)
+        # Parse torrent to get hash and info (infohash validates the metainfo itself)
+        torrent_obj = torf.Torrent.read_stream(torrent_data, validate=False)
         info_hash = torrent_obj.infohash
         torrent_bytes = torrent_data
         torrent_completed = False
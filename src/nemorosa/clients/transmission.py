@@ -1,5 +1,6 @@
 import base64
 import posixpath
+import time
 
 import msgspec
 import transmission_rpc
@@ -76,6 +77,13 @@ class TransmissionClient(TorrentClient):
         # Use the field specifications constant
         self.field_config = _TRANSMISSION_FIELD_SPECS
 
+        # Monitoring state, kept current from "recently-active" deltas between full refreshes
+        self._torrent_states_cache: dict[str, TorrentState] = {}
+        self._torrent_ids: dict[int, str] = {}  # Transmission torrent id -> hash, to apply removals
+        self._states_refreshed_at = 0.0
+        # Torrents that change state without counting as active are still picked up by this refresh
+        self._states_full_refresh_interval = 10.0
+
     # region Abstract Methods - Public Operations
 
     def get_torrents(
@@ -93,27 +101,15 @@ class TransmissionClient(TorrentClient):
             list[ClientTorrentInfo]: List of torrent information.
         """
         try:
-            # Get required arguments based on requested fields (always include hash)
-            field_config = (
-                {k: v for k, v in self.field_config.items() if k in fields or k == "hash"}
-                if fields
-                else self.field_config
-            )
-
-            # Get required Transmission properties based on requested fields
-            arguments = list(set().union(*[spec.request_arguments for spec in field_config.values()]))
+            # Get client properties needed for the requested fields
+            _, arguments = self._resolve_field_config(fields)
 
             # Get torrents from Transmission (filtered by hashes if provided)
             torrents = self.client.get_torrents(ids=torrent_hashes, arguments=arguments)  # type: ignore[arg-type]
 
             # Build ClientTorrentInfo objects
-            result = []
-            for torrent in torrents:
-                values = {field_name: spec.extractor(torrent) for field_name, spec in field_config.items()}
-                torrent_info = ClientTorrentInfo(**values)
-                result.append(torrent_info)
-
-            return result
+            build = self._get_torrent_info_builder(fields)
+            return [build(torrent) for torrent in torrents]
 
         except Exception as e:
             logger.error("Error retrieving torrents from Transmission: %s", e)
@@ -122,22 +118,13 @@ class TransmissionClient(TorrentClient):
     def get_torrent_info(self, torrent_hash: str, fields: list[str] | None) -> ClientTorrentInfo | None:
         """Get torrent information."""
         try:
-            # Get requested fields (always include hash)
-            field_config = (
-                {k: v for k, v in self.field_config.items() if k in fields or k == "hash"}
-                if fields
-                else self.field_config
-            )
-
-            # Get required arguments from field_config
-            arguments = list(set().union(*[spec.request_arguments for spec in field_config.values()]))
+            # Get client properties needed for the requested fields
+            _, arguments = self._resolve_field_config(fields)
 
             torrent = self.client.get_torrent(torrent_hash, arguments=arguments)
 
-            # Build ClientTorrentInfo using field_config
-            return ClientTorrentInfo(
-                **{field_name: spec.extractor(torrent) for field_name, spec in field_config.items()}
-            )
+            # Build ClientTorrentInfo for the requested fields
+            return self._get_torrent_info_builder(fields)(torrent)
         except Exception as e:
             logger.error("Error retrieving torrent info from Transmission: %s", e)
             return None
@@ -146,7 +133,9 @@ class TransmissionClient(TorrentClient):
         """Get torrent states for monitoring (optimized for Transmission).
 
         Uses Transmission's get_torrents with minimal fields to get only
-        the required state information for monitoring.
+        the required state information for monitoring. Between periodic full
+        refreshes only "recently-active" torrents are fetched and merged into
+        a state cache.
 
         Args:
             torrent_hashes (set[str]): Set of torrent hashes to monitor.
@@ -158,19 +147,38 @@ class TransmissionClient(TorrentClient):
             return {}
 
         try:
-            # Get minimal torrent info - only hash and status
-            torrents = self.client.get_torrents(
-                ids=list(torrent_hashes),
-                arguments=["hashString", "status"],  # Only get hash and status for efficiency
-            )
-
-            result = {
-                torrent.hash_string: TRANSMISSION_STATE_MAPPING.get(torrent.status.value, TorrentState.UNKNOWN)
-                for torrent in torrents
+            states_cache = self._torrent_states_cache
+            now = time.monotonic()
+            removed_ids = []
+            if (
+                not torrent_hashes <= states_cache.keys()
+                or now - self._states_refreshed_at >= self._states_full_refresh_interval
+            ):
+                # Get minimal torrent info for all requested torrents - only id, hash and status
+                torrents = self.client.get_torrents(ids=list(torrent_hashes), arguments=["id", "hashString", "status"])
+                self._states_refreshed_at = now
+            else:
+                # Only torrents that changed recently, plus ids of removed ones
+                torrents, removed_ids = self.client.get_recently_active_torrents(
+                    arguments=["id", "hashString", "status"]
+                )
+
+            state_get = TRANSMISSION_STATE_MAPPING.get
+            unknown = TorrentState.UNKNOWN
+            for torrent in torrents:
+                states_cache[torrent.hash_string] = state_get(torrent.status.value, unknown)
+                self._torrent_ids[torrent.id] = torrent.hash_string
+            for torrent_id in removed_ids:
+                torrent_hash = self._torrent_ids.pop(torrent_id, None)
+                if torrent_hash is not None:
+                    states_cache.pop(torrent_hash, None)
+
+            return {
+                torrent_hash: states_cache[torrent_hash]
+                for torrent_hash in torrent_hashes
+                if torrent_hash in states_cache
             }
 
-            return result
-
         except Exception as e:
             logger.error(f"Error getting torrent states for monitoring from Transmission: {e}")
             return {}
@@ -266,13 +274,17 @@ class TransmissionClient(TorrentClient):
         """Process rename mapping to adapt to Transmission."""
         temp_map = {}
         for torrent_name, local_name in rename_map.items():
-            torrent_name_list = torrent_name.split("/")
-            local_name_list = local_name.split("/")
             # Transmission cannot complete non-same-level moves
-            if len(torrent_name_list) == len(local_name_list):
-                for i in range(len(torrent_name_list)):
-                    if torrent_name_list[i] != local_name_list[i]:
-                        temp_map[("/".join(torrent_name_list[: i + 1]), local_name_list[i])] = i
+            if torrent_name.count("/") != local_name.count("/"):
+                continue
+            # Grow the torrent path prefix one component at a time instead of re-joining it per level
+            prefix = ""
+            for i, (torrent_part, local_part) in enumerate(
+                zip(torrent_name.split("/"), local_name.split("/"), strict=True)
+            ):
+                prefix = f"{prefix}/{torrent_part}" if i else torrent_part
+                if torrent_part != local_part:
+                    temp_map[(prefix, local_part)] = i
 
         transmission_map = {
             posixpath.join(base_path, key): value
@@ -1,5 +1,6 @@
 """Nemorosa configuration processing module."""
 
+import functools
 import os
 import secrets
 import sys
@@ -86,6 +87,19 @@ class DownloaderConfig(msgspec.Struct):
                     raise ValueError("tags cannot contain empty strings")
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_cadence(cadence: str) -> float:
+    """Parse a human friendly cadence such as "1 day" or "6 hours" into seconds.
+
+    Args:
+        cadence: Cadence string from configuration.
+
+    Returns:
+        float: Cadence in seconds.
+    """
+    return humanfriendly.parse_timespan(cadence)
+
+
 class ServerConfig(msgspec.Struct):
     """Server configuration."""
 
@@ -94,16 +108,21 @@ class ServerConfig(msgspec.Struct):
     api_key: str | None = None
     search_cadence: str | None = None  # Will be parsed to seconds via property
     cleanup_cadence: str = "1 day"  # Will be parsed to seconds via property
+    job_jitter_seconds: int | None = None  # None means about 5% of the job interval, between 5 and 60 seconds
 
     def __post_init__(self):
         # Validate port range
         if not isinstance(self.port, int) or not (1 <= self.port <= 65535):
             raise ValueError(f"Server port must be an integer between 1 and 65535, got: {self.port}")
 
+        # Validate job_jitter_seconds
+        if self.job_jitter_seconds is not None and self.job_jitter_seconds < 0:
+            raise ValueError(f"job_jitter_seconds must be 0 or greater, got: {self.job_jitter_seconds}")
+
         # Validate search_cadence
         if self.search_cadence is not None:
             try:
-                search_seconds = humanfriendly.parse_timespan(self.search_cadence)
+                search_seconds = _parse_cadence(self.search_cadence)
                 if search_seconds <= 0:
                     raise ValueError(f"search_cadence must be greater than 0, got: {search_seconds} seconds")
             except Exception as e:
@@ -111,7 +130,7 @@ class ServerConfig(msgspec.Struct):
 
         # Validate cleanup_cadence
         try:
-            cleanup_seconds = humanfriendly.parse_timespan(self.cleanup_cadence)
+            cleanup_seconds = _parse_cadence(self.cleanup_cadence)
             if cleanup_seconds <= 0:
                 raise ValueError(f"cleanup_cadence must be greater than 0, got: {cleanup_seconds} seconds")
         except Exception as e:
@@ -122,12 +141,12 @@ class ServerConfig(msgspec.Struct):
         """Get search cadence in seconds."""
         if self.search_cadence is None:
             return 0
-        return int(humanfriendly.parse_timespan(self.search_cadence))
+        return int(_parse_cadence(self.search_cadence))
 
     @property
     def cleanup_cadence_seconds(self) -> int:
         """Get cleanup cadence in seconds."""
-        return int(humanfriendly.parse_timespan(self.cleanup_cadence))
+        return int(_parse_cadence(self.cleanup_cadence))
 
 
 class TargetSiteConfig(msgspec.Struct):
@@ -283,6 +302,7 @@ server:
   # Scheduled job settings (optional, set to null to disable)
   search_cadence: "1 day"  # How often to run search job (e.g., "1 day", "6 hours", "30 minutes")
   cleanup_cadence: "1 day"  # How often to run cleanup job
+  job_jitter_seconds: null  # Random delay added to job runs, null for automatic, 0 for exact schedules
 
 downloader:
   # Downloader settings
@@ -1,8 +1,9 @@
 """Core processing functions for nemorosa."""
 
+import asyncio
 import traceback
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from urllib.parse import parse_qs, urlparse
 
 import msgspec
@@ -10,7 +11,7 @@ import torf
 from pydantic import BaseModel, Field
 
 from . import client_instance, config, db, filecompare, filelinking, logger
-from .api import get_target_apis
+from .api import get_target_apis, get_target_tracker_set, get_target_trackers
 from .clients import ClientTorrentInfo, TorrentConflictError
 
 if TYPE_CHECKING:
@@ -77,22 +78,100 @@ class NemorosaCore:
 
     stats: ProcessorStats
 
+    # Number of buffered scan results that triggers a database flush
+    SCAN_RESULT_FLUSH_SIZE = 100
+
     def __init__(self):
         """Initialize the torrent processor."""
         self.torrent_client = client_instance.get_torrent_client()
         self.database = db.get_database()
         self.stats = ProcessorStats()
+        # Infohashes already computed per (local torrent hash, source flag), so visiting
+        # the same torrent for several target sites does not re-hash its info dict.
+        # Only valid for one scan: entry points clear it when they start and finish
+        self._infohash_cache: dict[tuple[str, str], str] = {}
+        # Scan results and undownloaded torrents waiting to be written to the database in one batch
+        self._scan_result_buffer: list[dict[str, Any]] = []
+        self._undownloaded_buffer: list[dict[str, Any]] = []
+        # Scanned local torrent hashes per site host, prefetched for a full processing run
+        self._scanned_hashes: dict[str, set[str]] = {}
+        # A core may be reused across scheduled runs, full processing runs must not overlap on it
+        # since they share stats, _scanned_hashes and the infohash cache
+        self._process_lock = asyncio.Lock()
+
+    async def record_scan_result(
+        self,
+        *,
+        torrent_details: ClientTorrentInfo,
+        api: "GazelleJSONAPI | GazelleParser",
+        matched_torrent_id: str | None = None,
+        matched_torrent_hash: str | None = None,
+        flush: bool = False,
+    ):
+        """Buffer a scan result and flush the buffer when it is full or when requested.
+
+        Args:
+            torrent_details (ClientTorrentInfo): Scanned local torrent.
+            api: API instance for the target site.
+            matched_torrent_id (str | None): Matched torrent ID, None if not found.
+            matched_torrent_hash (str | None): Matched torrent hash, None if not found.
+            flush (bool): Write buffered results immediately.
+        """
+        if (scanned_hashes := self._scanned_hashes.get(api.site_host)) is not None:
+            scanned_hashes.add(torrent_details.hash)
+        self._scan_result_buffer.append(
+            {
+                "local_torrent_hash": torrent_details.hash,
+                "local_torrent_name": torrent_details.name,
+                "matched_torrent_id": matched_torrent_id,
+                "site_host": api.site_host,
+                "matched_torrent_hash": matched_torrent_hash,
+            }
+        )
+        if flush or len(self._scan_result_buffer) >= self.SCAN_RESULT_FLUSH_SIZE:
+            await self.flush_pending_results()
+
+    def record_undownloaded_torrent(self, torrent_id: str, torrent_info: dict[str, Any], site_host: str):
+        """Buffer an undownloaded torrent, it is written together with the next scan result flush.
+
+        Args:
+            torrent_id (str): Torrent ID on the target site.
+            torrent_info (dict): Dictionary containing download_dir, local_torrent_name, rename_map.
+            site_host (str): Site hostname.
+        """
+        self._undownloaded_buffer.append({"torrent_id": torrent_id, "site_host": site_host, **torrent_info})
+
+    async def flush_pending_results(self):
+        """Write all buffered scan results and undownloaded torrents to the database."""
+        scan_results, self._scan_result_buffer = self._scan_result_buffer, []
+        undownloaded, self._undownloaded_buffer = self._undownloaded_buffer, []
+
+        # Failed rows are put back into the buffers, so the next flush retries them
+        if scan_results:
+            try:
+                await self.database.add_scan_results(scan_results)
+            except Exception as e:
+                logger.error(f"Failed to save {len(scan_results)} scan results, keeping them for retry: {e}")
+                self._scan_result_buffer[:0] = scan_results
+        if undownloaded:
+            try:
+                await self.database.add_undownloaded_torrents(undownloaded)
+            except Exception as e:
+                logger.error(f"Failed to save {len(undownloaded)} undownloaded torrents, keeping them for retry: {e}")
+                self._undownloaded_buffer[:0] = undownloaded
 
     async def hash_based_search(
         self,
         *,
         torrent_object: torf.Torrent,
+        local_torrent_hash: str,
         api: "GazelleJSONAPI | GazelleParser",
     ) -> int | None:
         """Search for torrent using hash-based search.
 
         Args:
             torrent_object (torf.Torrent): Torrent object for hash calculation.
+            local_torrent_hash (str): Hash of the local torrent, used to cache computed infohashes.
             api: API instance for the target site.
 
         Returns:
@@ -115,10 +194,12 @@ class NemorosaCore:
         # Create a copy of the torrent and try different source flags
         for flag in source_flags:
             try:
-                torrent_object.source = flag
-
-                # Calculate hash
-                torrent_hash = torrent_object.infohash
+                # Calculate hash only on the first visit for this source flag
+                cache_key = (local_torrent_hash, flag)
+                torrent_hash = self._infohash_cache.get(cache_key)
+                if torrent_hash is None:
+                    torrent_object.source = flag
+                    torrent_hash = self._infohash_cache[cache_key] = torrent_object.infohash
 
                 # Search torrent by hash
                 search_result = await api.search_torrent_by_hash(torrent_hash)
@@ -129,6 +210,8 @@ class NemorosaCore:
                     torrent_id = search_result["response"]["torrent"]["id"]
                     if torrent_id:
                         tid = int(torrent_id)
+                        # Make sure the torrent carries the matched source flag before it is dumped
+                        torrent_object.source = flag
                         logger.success(f"Found match! Torrent ID: {tid}")
                         return tid
             except Exception as e:
@@ -329,17 +412,19 @@ class NemorosaCore:
         Returns:
             int | None: Torrent ID if found, None otherwise.
         """
+        # The file to compare and its size do not depend on the candidate torrent
+        check_music_file = fname if filecompare.is_music_file(fname) else scan_querys[-1]
+        check_file_size = fdict[check_music_file]
+
         for t_index, t in enumerate(torrents, 1):
             logger.debug(f"Checking torrent #{t_index}/{len(torrents)}: ID {t['torrentId']}")
 
             resp = await api.torrent(t["torrentId"])
             resp_files = resp.get("fileList", {})
 
-            check_music_file = fname if filecompare.is_music_file(fname) else scan_querys[-1]
-
             # For music files, byte-level size comparison is sufficient for identical matching
             # as it provides reliable file identification without requiring full content comparison
-            if fdict[check_music_file] in resp_files.values():
+            if check_file_size in resp_files.values():
                 # Check file conflicts
                 if config.cfg.linking.enable_linking or not filecompare.check_conflicts(fdict, resp_files):
                     logger.success(f"File match found! Torrent ID: {t['torrentId']} (File: {check_music_file})")
@@ -378,7 +463,9 @@ class NemorosaCore:
         # Try hash-based search first if torrent object is available
         if torrent_object:
             try:
-                tid = await self.hash_based_search(torrent_object=torrent_object, api=api)
+                tid = await self.hash_based_search(
+                    torrent_object=torrent_object, local_torrent_hash=torrent_details.hash, api=api
+                )
             except Exception as e:
                 logger.error(f"Hash-based search failed: {e}")
                 search_error_occurred = True
@@ -398,18 +485,14 @@ class NemorosaCore:
 
             # Record scan result: no matching torrent found
             if not search_error_occurred:
-                await self.database.add_scan_result(
-                    local_torrent_hash=torrent_details.hash,
-                    local_torrent_name=torrent_details.name,
-                    matched_torrent_id=None,
-                    site_host=api.site_host,
-                    matched_torrent_hash=None,
-                )
+                await self.record_scan_result(torrent_details=torrent_details, api=api)
             return None, False
 
         # Found a match
         self.stats.found += 1
         logger.success(f"Found match! Torrent ID: {tid}")
+        # Torrent IDs are stored as strings, convert once for all database writes below
+        torrent_id = str(tid)
 
         # If found via hash search, modify the existing torrent for the new tracker
         # Otherwise, download the torrent data
@@ -426,13 +509,14 @@ class NemorosaCore:
 
         # Generate file dictionary and rename map
         fdict_torrent = {"/".join(f.parts[1:]): f.size for f in torrent_object.files}
+        fdict_local = torrent_details.fdict  # Computed property, build it once
 
-        rename_map = filecompare.generate_rename_map(torrent_details.fdict, fdict_torrent)
+        rename_map = filecompare.generate_rename_map(fdict_local, fdict_torrent)
 
         # Handle file linking and rename map based on configuration
         if config.cfg.linking.enable_linking:
             # Generate link map for file linking
-            file_mapping = filecompare.generate_link_map(torrent_details.fdict, fdict_torrent)
+            file_mapping = filecompare.generate_link_map(fdict_local, fdict_torrent)
             # File linking mode: create links first, then add torrent with linked directory
             final_download_dir = filelinking.create_file_links_for_torrent(
                 torrent_object, torrent_details.download_dir, torrent_details.name, file_mapping
@@ -448,8 +532,12 @@ class NemorosaCore:
         downloaded = False
         if not config.cfg.global_config.no_download:
             try:
-                success, _ = self.torrent_client.inject_torrent(
-                    torrent_data, final_download_dir, torrent_details.name, rename_map, hash_match
+                success, _ = await self.torrent_client.inject_torrent_async(
+                    torrent_data,
+                    final_download_dir,
+                    torrent_details.name,
+                    rename_map,
+                    hash_match,
                 )
                 if success:
                     downloaded = True
@@ -472,30 +560,26 @@ class NemorosaCore:
                 # Torrent conflict - treat as no match found
                 logger.debug(f"Torrent conflict detected: {e}")
                 # Record scan result: no matching torrent found
-                await self.database.add_scan_result(
-                    local_torrent_hash=torrent_details.hash,
-                    local_torrent_name=torrent_details.name,
-                    matched_torrent_id=None,
-                    site_host=api.site_host,
-                    matched_torrent_hash=None,
-                )
+                await self.record_scan_result(torrent_details=torrent_details, api=api)
                 return None, False
 
-        # Record scan result: matching torrent found
-        await self.database.add_scan_result(
-            local_torrent_hash=torrent_details.hash,
-            local_torrent_name=torrent_details.name,
-            matched_torrent_id=str(tid),
-            site_host=api.site_host,
-            matched_torrent_hash=torrent_object.infohash,
-        )
         if not downloaded:
             torrent_info = {
                 "download_dir": final_download_dir,
                 "local_torrent_name": torrent_details.name,
                 "rename_map": rename_map,
             }
-            await self.database.add_undownloaded_torrent(str(tid), torrent_info, api.site_host)
+            self.record_undownloaded_torrent(torrent_id, torrent_info, api.site_host)
+
+        # Record scan result: matching torrent found
+        # Flush right away for injected torrents, verification post-processing looks them up by hash
+        await self.record_scan_result(
+            torrent_details=torrent_details,
+            api=api,
+            matched_torrent_id=torrent_id,
+            matched_torrent_hash=torrent_object.infohash,
+            flush=downloaded,
+        )
 
         # Start tracking verification after database operations are complete
         if downloaded:
@@ -517,7 +601,9 @@ class NemorosaCore:
         """
 
         # Try to get torrent data from torrent client for hash search
-        torrent_object = self.torrent_client.get_torrent_object(torrent_details.hash)
+        torrent_object = await self.torrent_client.run_blocking(
+            self.torrent_client.get_torrent_object, torrent_details.hash
+        )
 
         # Scan and match for each target site
         any_success = False
@@ -525,9 +611,14 @@ class NemorosaCore:
 
         for api_instance in get_target_apis():
             # Check if torrent has been scanned on this specific site
-            if await self.database.is_hash_scanned(
-                local_torrent_hash=torrent_details.hash, site_host=api_instance.site_host
-            ):
+            scanned_hashes = self._scanned_hashes.get(api_instance.site_host)
+            if scanned_hashes is not None:
+                already_scanned = torrent_details.hash in scanned_hashes
+            else:
+                already_scanned = await self.database.is_hash_scanned(
+                    local_torrent_hash=torrent_details.hash, site_host=api_instance.site_host
+                )
+            if already_scanned:
                 logger.debug(
                     "Skipping already scanned torrent on %s: %s (%s)",
                     api_instance.site_host,
@@ -562,15 +653,29 @@ class NemorosaCore:
 
     async def process_torrents(self):
         """Process torrents in client, supporting multiple target sites."""
+        async with self._process_lock:
+            await self._process_torrents()
+
+    async def _process_torrents(self):
+        """Run one full processing session, see process_torrents."""
         logger.section("===== Processing Torrents =====")
 
-        # Extract target_trackers from target_apis
-        target_trackers = [api_instance.tracker_query for api_instance in get_target_apis()]
+        # Target trackers are derived once when the target APIs are set
+        target_trackers = get_target_trackers()
 
-        # Reset stats for this processing session
+        # Reset stats and per-session caches for this processing session. Buffered results are
+        # kept, they only hold rows a previous flush failed to write
         self.stats = ProcessorStats()
+        self._infohash_cache.clear()
+        self._scanned_hashes.clear()
 
         try:
+            # Prefetch scan history once instead of querying it per torrent and site
+            for api_instance in get_target_apis():
+                self._scanned_hashes[api_instance.site_host] = await self.database.get_scanned_hashes(
+                    api_instance.site_host
+                )
+
             # Get filtered torrent list
             torrents = await self.torrent_client.get_filtered_torrents(target_trackers)
             logger.debug("Found %d torrents in client matching the criteria", len(torrents))
@@ -597,6 +702,14 @@ class NemorosaCore:
             logger.error("Error processing torrents: %s", e)
             logger.error(traceback.format_exc())
         finally:
+            await self.flush_pending_results()
+            self._scanned_hashes.clear()
+            self._infohash_cache.clear()
+            # Keep the WAL file small after a run that may have written many rows
+            try:
+                await self.database.checkpoint()
+            except Exception as e:
+                logger.debug(f"WAL checkpoint failed: {e}")
             logger.success("Torrent processing summary:")
             logger.success("Torrents scanned: %d", self.stats.scanned)
             logger.success("Matches found: %d", self.stats.found)
@@ -626,45 +739,53 @@ class NemorosaCore:
                     f"Found {len(undownloaded_torrents)} undownloaded torrents for site: {api_instance.server}"
                 )
 
-                for torrent_id, torrent_info in undownloaded_torrents.items():
-                    retry_stats.attempted += 1
-                    logger.header(
-                        f"Retrying torrent ID: {torrent_id} ({retry_stats.attempted}/{len(undownloaded_torrents)})"
-                    )
-
-                    try:
-                        # Download torrent data
-                        torrent_data = await api_instance.download_torrent(torrent_id)
-
-                        # Get torrent information
-                        download_dir = torrent_info.get("download_dir", "")
-                        local_torrent_name = torrent_info.get("local_torrent_name", "")
-                        rename_map = torrent_info.get("rename_map", {})
-
-                        logger.debug(f"Attempting to inject torrent: {local_torrent_name}")
-                        logger.debug(f"Download directory: {download_dir}")
-                        logger.debug(f"Rename map: {rename_map}")
-
-                        # Try to inject torrent into client
-                        success, _ = self.torrent_client.inject_torrent(
-                            torrent_data, download_dir, local_torrent_name, rename_map, False
+                # Injected torrents are removed from undownloaded table in one batch per site
+                injected_torrent_ids: list[str] = []
+                try:
+                    for torrent_id, torrent_info in undownloaded_torrents.items():
+                        retry_stats.attempted += 1
+                        logger.header(
+                            f"Retrying torrent ID: {torrent_id} ({retry_stats.attempted}/{len(undownloaded_torrents)})"
                         )
-                        if success:
-                            retry_stats.successful += 1
-                            retry_stats.removed += 1
-
-                            # Injection successful, remove from undownloaded table
-                            await self.database.remove_undownloaded_torrent(torrent_id, api_instance.site_host)
-                            logger.success(f"Successfully downloaded and injected torrent {torrent_id}")
-                            logger.success(f"Removed torrent {torrent_id} from undownloaded list")
-                        else:
-                            retry_stats.failed += 1
-                            logger.error(f"Failed to inject torrent {torrent_id}")
 
-                    except Exception as e:
-                        retry_stats.failed += 1
-                        logger.error(f"Error processing torrent {torrent_id}: {e}")
-                        continue
+                        try:
+                            # Download torrent data
+                            torrent_data = await api_instance.download_torrent(torrent_id)
+
+                            # Get torrent information
+                            download_dir = torrent_info.download_dir or ""
+                            local_torrent_name = torrent_info.local_torrent_name or ""
+                            rename_map = torrent_info.rename_map
+
+                            logger.debug(f"Attempting to inject torrent: {local_torrent_name}")
+                            logger.debug(f"Download directory: {download_dir}")
+                            logger.debug(f"Rename map: {rename_map}")
+
+                            # Try to inject torrent into client
+                            success, _ = await self.torrent_client.inject_torrent_async(
+                                torrent_data,
+                                download_dir,
+                                local_torrent_name,
+                                rename_map,
+                                False,
+                            )
+                            if success:
+                                retry_stats.successful += 1
+                                injected_torrent_ids.append(torrent_id)
+                                logger.success(f"Successfully downloaded and injected torrent {torrent_id}")
+                            else:
+                                retry_stats.failed += 1
+                                logger.error(f"Failed to inject torrent {torrent_id}")
+
+                        except Exception as e:
+                            retry_stats.failed += 1
+                            logger.error(f"Error processing torrent {torrent_id}: {e}")
+                            continue
+                finally:
+                    if injected_torrent_ids:
+                        await self.database.remove_undownloaded_torrents(injected_torrent_ids, api_instance.site_host)
+                        retry_stats.removed += len(injected_torrent_ids)
+                        logger.success(f"Removed {len(injected_torrent_ids)} torrents from undownloaded list")
 
         except Exception as e:
             logger.error("Error retrying undownloaded torrents: %s", e)
@@ -699,12 +820,11 @@ class NemorosaCore:
 
             logger.info(f"Found {len(matched_results)} matched torrents")
 
-            # Process all matched results
-            for matched_torrent_hash in matched_results:
-                stats.matches_checked += 1
+            # Process all matched results with one client lookup and one checked-status update
+            results = await self.torrent_client.post_process_injected_torrents(list(matched_results))
 
-                # Process single torrent
-                result = await self.torrent_client.post_process_single_injected_torrent(matched_torrent_hash)
+            for result in results.values():
+                stats.matches_checked += 1
 
                 # Update stats based on result
                 if result.status == "completed":
@@ -743,12 +863,16 @@ class NemorosaCore:
             ProcessResponse: Processing result with status and details.
         """
 
+        self._infohash_cache.clear()
+
         try:
-            # Extract target_trackers from target_apis
-            target_trackers = [api_instance.tracker_query for api_instance in get_target_apis()]
+            # Target trackers are derived once when the target APIs are set
+            target_trackers = get_target_trackers()
 
             # Get torrent details from torrent client with existing trackers info
-            torrent_info = self.torrent_client.get_single_torrent(infohash, target_trackers)
+            torrent_info = await self.torrent_client.run_blocking(
+                self.torrent_client.get_single_torrent, infohash, target_trackers
+            )
 
             if not torrent_info:
                 return ProcessResponse(
@@ -757,13 +881,10 @@ class NemorosaCore:
                 )
 
             # Check if torrent already exists on all target trackers
-            existing_trackers = set(torrent_info.existing_target_trackers)
-            target_tracker_set = set(target_trackers)
-
-            if target_tracker_set.issubset(existing_trackers):
+            if get_target_tracker_set().issubset(torrent_info.existing_target_trackers):
                 return ProcessResponse(
                     status=ProcessStatus.SKIPPED,
-                    message=f"Torrent already exists on all target trackers: {list(existing_trackers)}",
+                    message=f"Torrent already exists on all target trackers: {torrent_info.existing_target_trackers}",
                 )
 
             # Process the torrent using the same logic as process_single_torrent_from_client
@@ -785,6 +906,9 @@ class NemorosaCore:
         except Exception as e:
             logger.error(f"Error processing single torrent {infohash}: {str(e)}")
             return ProcessResponse(status=ProcessStatus.ERROR, message=f"Error processing torrent: {str(e)}")
+        finally:
+            await self.flush_pending_results()
+            self._infohash_cache.clear()
 
     async def process_reverse_announce_torrent(
         self,
@@ -851,13 +975,14 @@ class NemorosaCore:
             matched_torrent = max(matched_torrents, key=lambda x: len(x.files))
             logger.success(f"Found matching torrent in client: {matched_torrent.name}")
 
-            # Use client's file dictionary
-            rename_map = filecompare.generate_rename_map(matched_torrent.fdict, fdict_torrent)
+            # Use client's file dictionary (computed property, build it once)
+            fdict_local = matched_torrent.fdict
+            rename_map = filecompare.generate_rename_map(fdict_local, fdict_torrent)
 
             # Handle file linking and rename map based on configuration
             if config.cfg.linking.enable_linking:
                 # Generate link map for file linking
-                file_mapping = filecompare.generate_link_map(matched_torrent.fdict, fdict_torrent)
+                file_mapping = filecompare.generate_link_map(fdict_local, fdict_torrent)
                 # File linking mode: create links first, then add torrent with linked directory
                 final_download_dir = filelinking.create_file_links_for_torrent(
                     torrent_object, matched_torrent.download_dir, matched_torrent.name, file_mapping
@@ -872,7 +997,7 @@ class NemorosaCore:
             # Inject torrent and handle renaming
             downloaded = False
             if not config.cfg.global_config.no_download:
-                success, _ = self.torrent_client.inject_torrent(
+                success, _ = await self.torrent_client.inject_torrent_async(
                     torrent_data, final_download_dir, matched_torrent.name, rename_map, False
                 )
                 if success:
@@ -890,7 +1015,7 @@ class NemorosaCore:
                     "local_torrent_name": matched_torrent.name,
                     "rename_map": rename_map,
                 }
-                await self.database.add_undownloaded_torrent(str(tid), torrent_info, str(parsed_link.hostname))
+                await self.database.add_undownloaded_torrent(tid, torrent_info, str(parsed_link.hostname))
 
             return ProcessResponse(
                 status=ProcessStatus.SUCCESS,
@@ -3,14 +3,30 @@ Database operation module.
 Provides SQLite storage functionality for torrent scan history, result mapping, URL records and other data.
 """
 
+import functools
 import os
 import threading
+from collections.abc import AsyncIterator
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 import msgspec
 from platformdirs import user_config_dir
-from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, delete, func, select, text, update
+from sqlalchemy import (
+    Boolean,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    bindparam,
+    delete,
+    event,
+    exists,
+    func,
+    select,
+    text,
+    update,
+)
 from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
@@ -20,6 +36,10 @@ from . import config
 if TYPE_CHECKING:
     from .clients.client_common import ClientTorrentInfo
 
+# Reusable JSON codecs for the TEXT columns holding tracker lists and rename maps
+_json_encoder = msgspec.json.Encoder()
+_rename_map_decoder = msgspec.json.Decoder(dict[str, str])
+
 
 # Define declarative base using SQLAlchemy 2.0 style
 class Base(DeclarativeBase):
@@ -42,7 +62,17 @@ class ScanResult(Base):
     checked: Mapped[bool] = mapped_column(Boolean, server_default="0")
     scanned_at: Mapped[datetime] = mapped_column(server_default=func.now())
 
-    __table_args__ = (Index("idx_scan_results_matched_checked", "matched_torrent_hash", "checked"),)
+    __table_args__ = (
+        Index("idx_scan_results_matched_checked", "matched_torrent_hash", "checked"),
+        # Covering index for loading all scanned hashes of one site
+        Index("idx_scan_results_site_hash", "site_host", "local_torrent_hash"),
+        # Partial index holding only matched rows, for loading the unchecked ones in post-processing
+        Index(
+            "idx_scan_results_checked_matched",
+            "checked",
+            sqlite_where=text("matched_torrent_hash IS NOT NULL"),
+        ),
+    )
 
 
 class UndownloadedTorrent(Base):
@@ -54,7 +84,8 @@ class UndownloadedTorrent(Base):
     site_host: Mapped[str] = mapped_column(String, primary_key=True, server_default="default")
     download_dir: Mapped[str | None] = mapped_column(String)
     local_torrent_name: Mapped[str | None] = mapped_column(String)
-    rename_map: Mapped[str | None] = mapped_column(String)  # JSON format
+    # JSON format, stored as the raw encoded bytes (older rows hold TEXT, both decode the same)
+    rename_map: Mapped[bytes | str | None] = mapped_column(String)
     added_at: Mapped[datetime] = mapped_column(server_default=func.now())
 
     __table_args__ = (Index("idx_undownloaded_site_host", "site_host"),)
@@ -64,6 +95,8 @@ class JobLog(Base):
     """Job log table - for scheduler job tracking."""
 
     __tablename__ = "job_log"
+    # Point lookups by job_name only, the primary key B-tree can hold the rows directly
+    __table_args__ = {"sqlite_with_rowid": False}
 
     job_name: Mapped[str] = mapped_column(String, primary_key=True)
     last_run: Mapped[datetime | None] = mapped_column()
@@ -81,7 +114,8 @@ class ClientTorrent(Base):
     name: Mapped[str] = mapped_column(String, nullable=False)
     total_size: Mapped[int] = mapped_column(Integer, nullable=False)
     download_dir: Mapped[str | None] = mapped_column(String)
-    trackers: Mapped[str | None] = mapped_column(String)  # JSON array
+    # JSON array, raw encoded bytes like UndownloadedTorrent.rename_map
+    trackers: Mapped[bytes | str | None] = mapped_column(String)
 
     @classmethod
     def from_client_info(cls, info: "ClientTorrentInfo") -> "ClientTorrent":
@@ -101,7 +135,7 @@ class ClientTorrent(Base):
             name=info.name,
             total_size=info.total_size,
             download_dir=info.download_dir or None,
-            trackers=msgspec.json.encode(info.trackers).decode() if info.trackers else None,
+            trackers=_json_encoder.encode(info.trackers) if info.trackers else None,
         )
 
 
@@ -116,7 +150,14 @@ class TorrentFile(Base):
     file_path: Mapped[str] = mapped_column(String, primary_key=True)
     file_size: Mapped[int] = mapped_column(Integer, nullable=False)
 
-    __table_args__ = (Index("idx_torrent_files_size", "file_size"),)
+    __table_args__ = (
+        # Covering index for search_torrent_by_file_match: the size lookup and the keyword
+        # filtering on file_path are resolved from the index without visiting table rows
+        Index("idx_torrent_files_size_path", "file_size", "file_path", "torrent_hash"),
+        # Covering index for listing the files of a torrent ordered by path, includes file_size
+        # so joins from client_torrents never need to visit table rows
+        Index("idx_torrent_files_covering", "torrent_hash", "file_path", "file_size"),
+    )
 
 
 class Metadata(Base):
@@ -128,6 +169,198 @@ class Metadata(Base):
     value: Mapped[str | None] = mapped_column(String)
 
 
+class UndownloadedTorrentInfo(msgspec.Struct):
+    """Undownloaded torrent row as returned by load_undownloaded_torrents."""
+
+    download_dir: str | None
+    local_torrent_name: str | None
+    rename_map: dict[str, str]
+
+
+class MatchedScanResult(msgspec.Struct):
+    """Unchecked matched scan result row as returned by get_matched_scan_results."""
+
+    local_torrent_hash: str
+    local_torrent_name: str | None
+    matched_torrent_id: str | None
+    site_host: str
+
+
+# Frequently executed statements, built once and reused with bound parameters
+_IS_HASH_SCANNED_STMT = select(
+    exists().where(
+        ScanResult.local_torrent_hash == bindparam("local_torrent_hash"),
+        ScanResult.site_host == bindparam("site_host"),
+    )
+)
+_GET_SCANNED_HASHES_STMT = select(ScanResult.local_torrent_hash).where(ScanResult.site_host == bindparam("site_host"))
+_LOAD_UNDOWNLOADED_STMT = select(
+    UndownloadedTorrent.torrent_id,
+    UndownloadedTorrent.download_dir,
+    UndownloadedTorrent.local_torrent_name,
+    UndownloadedTorrent.rename_map,
+).where(UndownloadedTorrent.site_host == bindparam("site_host"))
+_GET_MATCHED_SCAN_RESULTS_STMT = select(
+    ScanResult.matched_torrent_hash,
+    ScanResult.local_torrent_hash,
+    ScanResult.local_torrent_name,
+    ScanResult.matched_torrent_id,
+    ScanResult.site_host,
+).where(
+    ScanResult.matched_torrent_hash.is_not(None),
+    ScanResult.checked.is_(False),
+)
+_GET_CACHED_HASHES_STMT = select(ClientTorrent.hash)
+_GET_CLIENT_TORRENTS_BASIC_STMT = select(ClientTorrent.hash, ClientTorrent.name, ClientTorrent.download_dir)
+_GET_METADATA_STMT = select(Metadata.value).where(Metadata.key == bindparam("key"))
+_GET_JOB_LOG_STMT = select(JobLog.last_run, JobLog.next_run, JobLog.run_count).where(
+    JobLog.job_name == bindparam("job_name")
+)
+# Single UPSERT: first run inserts run_count=1, later runs increment it in place
+_job_run_insert = insert(JobLog).values(
+    job_name=bindparam("job_name"), last_run=bindparam("last_run"), next_run=bindparam("next_run"), run_count=1
+)
+_UPDATE_JOB_RUN_STMT = _job_run_insert.on_conflict_do_update(
+    index_elements=["job_name"],
+    set_={
+        "last_run": _job_run_insert.excluded.last_run,
+        "next_run": _job_run_insert.excluded.next_run,
+        "run_count": JobLog.run_count + 1,
+    },
+)
+
+
+# Seconds a writer waits for the write lock held by another process (SQLite busy_timeout)
+_WRITE_LOCK_TIMEOUT = 5
+
+# Seconds a writer in this process waits for the single pooled write connection. Long enough to
+# outlast a full cache rebuild batch, so concurrent writers queue behind it instead of failing
+_WRITE_POOL_TIMEOUT = 300
+
+# PRAGMAs applied to every new SQLite connection in the pool
+_SQLITE_PRAGMAS = (
+    # WAL lets readers run alongside the writer, NORMAL sync only fsyncs at checkpoints
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    f"PRAGMA busy_timeout={_WRITE_LOCK_TIMEOUT * 1000}",
+    # Maps the same file for every connection, so pages are shared through the OS page cache
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    # SQLite ships with foreign keys off, torrent_files relies on ON DELETE CASCADE
+    "PRAGMA foreign_keys=ON",
+)
+
+# Page cache sizes are per connection: the single write connection gets a large one, while the
+# read pool is capped and each read connection keeps a smaller cache
+_WRITE_CACHE_SIZE_PRAGMA = "PRAGMA cache_size=-65536"  # 64 MiB
+_READ_CACHE_SIZE_PRAGMA = "PRAGMA cache_size=-16384"  # 16 MiB
+_READ_POOL_SIZE = 4
+_READ_POOL_MAX_OVERFLOW = 4
+
+# sqlite3 keeps a per-connection LRU of prepared statements (default 128), SQLAlchemy
+# already caches the compiled SQL strings, so a larger cap lets every query in this module stay prepared
+_SQLITE_CONNECT_ARGS = {"cached_statements": 256}
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply performance PRAGMAs when the pool opens a new connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _set_write_cache_size(dbapi_connection, connection_record):
+    """Give the write connection its large page cache."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(_WRITE_CACHE_SIZE_PRAGMA)
+    cursor.close()
+
+
+def _set_read_cache_size(dbapi_connection, connection_record):
+    """Give read connections a smaller page cache, see _READ_CACHE_SIZE_PRAGMA."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(_READ_CACHE_SIZE_PRAGMA)
+    cursor.close()
+
+
+def _disable_implicit_begin(dbapi_connection, connection_record):
+    """Stop the sqlite3 driver from issuing its own deferred BEGIN, see _begin_immediate."""
+    dbapi_connection.isolation_level = None
+
+
+def _begin_immediate(conn):
+    """Start write transactions with BEGIN IMMEDIATE.
+
+    A deferred BEGIN only takes the write lock at the first write and can fail with
+    SQLITE_BUSY when upgrading. Taking it up front lets busy_timeout handle the wait.
+    """
+    if conn.get_execution_options().get("isolation_level") != "AUTOCOMMIT":
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def _set_sqlite_query_only(dbapi_connection, connection_record):
+    """Make connections of the read-only pool reject any write."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
+
+
+@functools.cache
+def _default_db_path() -> str:
+    """Resolve the default database path in the user config directory once."""
+    return os.path.join(user_config_dir(config.APPNAME), "nemorosa.db")
+
+
+# Stored in PRAGMA user_version once the schema is up to date, bump whenever tables or indexes change
+_SCHEMA_VERSION = 2
+
+# Rows sampled per index by ANALYZE, within the range SQLite suggests for running PRAGMA optimize
+_ANALYSIS_LIMIT = 400
+
+# Indexes created by earlier versions and superseded by the ones declared on the models
+_OBSOLETE_INDEXES = ("idx_torrent_files_size",)
+
+
+def _migrate_job_log_without_rowid(sync_conn):
+    """Recreate a job_log table created by earlier versions as a WITHOUT ROWID table."""
+    table_sql = sync_conn.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'job_log'"
+    ).scalar()
+    if table_sql is None or "WITHOUT ROWID" in table_sql.upper():
+        return
+
+    sync_conn.exec_driver_sql("ALTER TABLE job_log RENAME TO job_log_old")
+    JobLog.__table__.create(sync_conn)
+    sync_conn.exec_driver_sql(
+        "INSERT INTO job_log (job_name, last_run, next_run, run_count, created_at) "
+        "SELECT job_name, last_run, next_run, run_count, created_at FROM job_log_old"
+    )
+    sync_conn.exec_driver_sql("DROP TABLE job_log_old")
+
+
+def _create_schema(sync_conn):
+    """Create missing tables and indexes."""
+    _migrate_job_log_without_rowid(sync_conn)
+    Base.metadata.create_all(sync_conn)
+    for index_name in _OBSOLETE_INDEXES:
+        sync_conn.exec_driver_sql(f"DROP INDEX IF EXISTS {index_name}")
+    # create_all only creates indexes together with new tables, add indexes introduced later
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+    sync_conn.exec_driver_sql(f"PRAGMA user_version={_SCHEMA_VERSION}")
+
+
+def _encode_rename_map(rename_map: dict[str, str] | None) -> bytes | None:
+    """Encode rename map to JSON, storing NULL for the common empty case.
+
+    Most matches need no renaming, so skipping the JSON round-trip for empty maps
+    saves work on both write and load (NULL is decoded back to an empty dict).
+    """
+    return _json_encoder.encode(rename_map) if rename_map else None
+
+
 class NemorosaDatabase:
     """Nemorosa database management class using SQLAlchemy async API."""
 
@@ -137,34 +370,72 @@ class NemorosaDatabase:
         Args:
             db_path: Database file path, if None uses config directory.
         """
-        self.db_path = (
-            os.path.abspath(db_path) if db_path else os.path.join(user_config_dir(config.APPNAME), "nemorosa.db")
-        )
+        self.db_path = os.path.abspath(db_path) if db_path else _default_db_path()
 
         # Ensure database directory exists
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        db_dir = os.path.dirname(self.db_path)
+        if not os.path.isdir(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
 
         # Create async engine with SQLAlchemy 2.0 style
         self.engine: AsyncEngine = create_async_engine(
             f"sqlite+aiosqlite:///{self.db_path}",
             echo=False,
             future=True,
+            connect_args=_SQLITE_CONNECT_ARGS,
+            # SQLite allows a single writer anyway (WAL serializes all writes on one lock), so one
+            # pooled connection makes concurrent writers wait on the asyncio pool queue instead of
+            # spinning on busy_timeout in worker threads, see _WRITE_POOL_TIMEOUT for how long
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=_WRITE_POOL_TIMEOUT,
         )
+        event.listen(self.engine.sync_engine, "connect", _set_sqlite_pragmas)
+        event.listen(self.engine.sync_engine, "connect", _set_write_cache_size)
+        event.listen(self.engine.sync_engine, "connect", _disable_implicit_begin)
+        event.listen(self.engine.sync_engine, "begin", _begin_immediate)
 
-        # Create async session factory
+        # Separate read-only engine, so lookups never queue behind writer connections
+        self.read_engine: AsyncEngine = create_async_engine(
+            f"sqlite+aiosqlite:///{self.db_path}",
+            echo=False,
+            future=True,
+            connect_args=_SQLITE_CONNECT_ARGS,
+            # query_only connections never hold a write transaction, and the session already ends
+            # its own read transaction, so skip the extra rollback round-trip on pool check-in
+            pool_reset_on_return=None,
+            # Explicit bound on read connections, each one holds its own page cache
+            pool_size=_READ_POOL_SIZE,
+            max_overflow=_READ_POOL_MAX_OVERFLOW,
+        )
+        event.listen(self.read_engine.sync_engine, "connect", _set_sqlite_pragmas)
+        event.listen(self.read_engine.sync_engine, "connect", _set_read_cache_size)
+        event.listen(self.read_engine.sync_engine, "connect", _set_sqlite_query_only)
+
+        # Create async session factories
         self.async_session_maker: async_sessionmaker[AsyncSession] = async_sessionmaker(
             self.engine,
             class_=AsyncSession,
             expire_on_commit=False,
         )
+        self.read_session_maker: async_sessionmaker[AsyncSession] = async_sessionmaker(
+            self.read_engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
 
     async def init_database(self):
         """Initialize database table structure asynchronously."""
-        async with self.engine.begin() as conn:
-            # Enable WAL mode for better concurrency
-            await conn.execute(text("PRAGMA journal_mode=WAL"))
-            # Create all tables defined in Base metadata
-            await conn.run_sync(Base.metadata.create_all)
+        # Skip schema creation (and the write lock it takes) when the schema is already current
+        async with self.read_engine.connect() as conn:
+            user_version = (await conn.exec_driver_sql("PRAGMA user_version")).scalar()
+        if user_version != _SCHEMA_VERSION:
+            async with self.engine.begin() as conn:
+                # Create all tables and indexes defined in Base metadata
+                await conn.run_sync(_create_schema)
+
+        # Gather planner statistics for tables that were never analyzed, as recommended for long-lived processes
+        await self.optimize(0x10002)
 
     # region Scan results
 
@@ -185,16 +456,45 @@ class NemorosaDatabase:
             site_host: Site hostname.
             matched_torrent_hash: Matched torrent hash.
         """
+        # Single-row UPSERT, avoids the SELECT that merge() issues before writing
+        await self.add_scan_results(
+            [
+                {
+                    "local_torrent_hash": local_torrent_hash,
+                    "site_host": site_host,
+                    "local_torrent_name": local_torrent_name,
+                    "matched_torrent_id": matched_torrent_id,
+                    "matched_torrent_hash": matched_torrent_hash,
+                }
+            ]
+        )
+
+    async def add_scan_results(self, scan_results: list[dict[str, Any]]):
+        """Batch add or update scan result records in a single transaction.
+
+        Args:
+            scan_results: List of dictionaries with local_torrent_hash, site_host, local_torrent_name,
+                matched_torrent_id and matched_torrent_hash keys.
+        """
+        if not scan_results:
+            return
+
+        # SQLite has a limit on number of SQL variables (32766 after 3.32.0)
+        SCAN_RESULT_BATCH_SIZE = 6553  # 32765 // 5
+
         async with self.async_session_maker.begin() as session:
-            # Use merge to insert or update
-            scan_result = ScanResult(
-                local_torrent_hash=local_torrent_hash,
-                site_host=site_host,
-                local_torrent_name=local_torrent_name,
-                matched_torrent_id=matched_torrent_id,
-                matched_torrent_hash=matched_torrent_hash,
-            )
-            await session.merge(scan_result)
+            for i in range(0, len(scan_results), SCAN_RESULT_BATCH_SIZE):
+                stmt = insert(ScanResult).values(scan_results[i : i + SCAN_RESULT_BATCH_SIZE])
+                # On conflict keep checked/scanned_at of the existing row
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["local_torrent_hash", "site_host"],
+                    set_={
+                        "local_torrent_name": stmt.excluded.local_torrent_name,
+                        "matched_torrent_id": stmt.excluded.matched_torrent_id,
+                        "matched_torrent_hash": stmt.excluded.matched_torrent_hash,
+                    },
+                )
+                await session.execute(stmt)
 
     async def is_hash_scanned(self, local_torrent_hash: str, site_host: str) -> bool:
         """Check if specified local torrent hash has been scanned on specific site.
@@ -206,18 +506,53 @@ class NemorosaDatabase:
         Returns:
             True if scanned on the specific site, False otherwise.
         """
-        async with self.async_session_maker() as session:
-            stmt = select(ScanResult).where(
-                ScanResult.local_torrent_hash == local_torrent_hash, ScanResult.site_host == site_host
+        async with self.read_session_maker() as session:
+            result = await session.execute(
+                _IS_HASH_SCANNED_STMT, {"local_torrent_hash": local_torrent_hash, "site_host": site_host}
             )
-            result = await session.execute(stmt)
-            return result.scalar_one_or_none() is not None
+            return bool(result.scalar())
+
+    async def get_scanned_hashes(self, site_host: str) -> set[str]:
+        """Get all local torrent hashes that have been scanned on specific site.
+
+        Args:
+            site_host: Site hostname.
+
+        Returns:
+            Set of scanned local torrent hashes.
+        """
+        async with self.read_session_maker() as session:
+            result = await session.execute(_GET_SCANNED_HASHES_STMT, {"site_host": site_host})
+            return set(result.scalars())
 
     # endregion
 
     # region Undownloaded torrents
 
-    async def load_undownloaded_torrents(self, site_host: str = "default") -> dict[str, dict[str, Any]]:
+    async def iter_undownloaded_torrents(
+        self, site_host: str = "default"
+    ) -> AsyncIterator[tuple[str, UndownloadedTorrentInfo]]:
+        """Iterate undownloaded torrent information for specified site without loading all rows at once.
+
+        Args:
+            site_host: Site hostname, defaults to 'default'.
+
+        Yields:
+            Tuples of torrent ID and detailed information.
+        """
+        async with self.read_session_maker() as session:
+            result = await session.stream(_LOAD_UNDOWNLOADED_STMT, {"site_host": site_host})
+            async for torrent_id, download_dir, local_torrent_name, rename_map in result:
+                yield (
+                    torrent_id,
+                    UndownloadedTorrentInfo(
+                        download_dir,
+                        local_torrent_name,
+                        _rename_map_decoder.decode(rename_map) if rename_map else {},
+                    ),
+                )
+
+    async def load_undownloaded_torrents(self, site_host: str = "default") -> dict[str, UndownloadedTorrentInfo]:
         """Load undownloaded torrent information for specified site.
 
         Args:
@@ -226,20 +561,9 @@ class NemorosaDatabase:
         Returns:
             Mapping dictionary from torrent ID to detailed information.
         """
-        async with self.async_session_maker() as session:
-            stmt = select(UndownloadedTorrent).where(UndownloadedTorrent.site_host == site_host)
-            result_set = await session.execute(stmt)
-            torrents = result_set.scalars().all()
-
-            result = {
-                torrent.torrent_id: {
-                    "download_dir": torrent.download_dir,
-                    "local_torrent_name": torrent.local_torrent_name,
-                    "rename_map": msgspec.json.decode(torrent.rename_map) if torrent.rename_map else {},
-                }
-                for torrent in torrents
-            }
-            return result
+        return {
+            torrent_id: torrent_info async for torrent_id, torrent_info in self.iter_undownloaded_torrents(site_host)
+        }
 
     async def add_undownloaded_torrent(self, torrent_id: str, torrent_info: dict, site_host: str = "default"):
         """Add undownloaded torrent information.
@@ -249,15 +573,47 @@ class NemorosaDatabase:
             torrent_info: Dictionary containing download_dir, local_torrent_name, rename_map.
             site_host: Site hostname.
         """
+        await self.add_undownloaded_torrents(
+            [
+                {
+                    "torrent_id": torrent_id,
+                    "site_host": site_host,
+                    "download_dir": torrent_info.get("download_dir"),
+                    "local_torrent_name": torrent_info.get("local_torrent_name"),
+                    "rename_map": torrent_info.get("rename_map"),
+                }
+            ]
+        )
+
+    async def add_undownloaded_torrents(self, torrents: list[dict[str, Any]]):
+        """Batch add or update undownloaded torrent information in a single transaction.
+
+        Args:
+            torrents: List of dictionaries with torrent_id, site_host, download_dir,
+                local_torrent_name and rename_map keys.
+        """
+        if not torrents:
+            return
+
+        # SQLite has a limit on number of SQL variables (32766 after 3.32.0)
+        UNDOWNLOADED_BATCH_SIZE = 6553  # 32765 // 5
+
+        undownloaded_data = [
+            {**torrent, "rename_map": _encode_rename_map(torrent.get("rename_map"))} for torrent in torrents
+        ]
+
         async with self.async_session_maker.begin() as session:
-            undownloaded = UndownloadedTorrent(
-                torrent_id=torrent_id,
-                site_host=site_host,
-                download_dir=torrent_info.get("download_dir"),
-                local_torrent_name=torrent_info.get("local_torrent_name"),
-                rename_map=msgspec.json.encode(torrent_info.get("rename_map", {})).decode(),
-            )
-            await session.merge(undownloaded)
+            for i in range(0, len(undownloaded_data), UNDOWNLOADED_BATCH_SIZE):
+                stmt = insert(UndownloadedTorrent).values(undownloaded_data[i : i + UNDOWNLOADED_BATCH_SIZE])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["torrent_id", "site_host"],
+                    set_={
+                        "download_dir": stmt.excluded.download_dir,
+                        "local_torrent_name": stmt.excluded.local_torrent_name,
+                        "rename_map": stmt.excluded.rename_map,
+                    },
+                )
+                await session.execute(stmt)
 
     async def remove_undownloaded_torrent(self, torrent_id: str, site_host: str = "default"):
         """Remove specified torrent from undownloaded torrents table.
@@ -272,29 +628,44 @@ class NemorosaDatabase:
             )
             await session.execute(stmt)
 
-    async def get_matched_scan_results(self) -> dict[str, dict[str, Any]]:
+    async def remove_undownloaded_torrents(self, torrent_ids: list[str], site_host: str = "default"):
+        """Remove multiple torrents of one site from undownloaded torrents table in a single transaction.
+
+        Args:
+            torrent_ids: Torrent IDs to remove.
+            site_host: Site hostname.
+        """
+        if not torrent_ids:
+            return
+
+        # SQLite has a limit on number of SQL variables (32766 after 3.32.0), one is used by site_host
+        TORRENT_ID_BATCH_SIZE = 32765
+
+        async with self.async_session_maker.begin() as session:
+            for i in range(0, len(torrent_ids), TORRENT_ID_BATCH_SIZE):
+                stmt = delete(UndownloadedTorrent).where(
+                    UndownloadedTorrent.site_host == site_host,
+                    UndownloadedTorrent.torrent_id.in_(torrent_ids[i : i + TORRENT_ID_BATCH_SIZE]),
+                )
+                await session.execute(stmt)
+
+    async def get_matched_scan_results(self) -> dict[str, MatchedScanResult]:
         """Get scan results with matched torrent hash for all sites that haven't been checked.
 
         Returns:
             Dictionary mapping matched_torrent_hash to scan result information.
         """
-        async with self.async_session_maker() as session:
-            stmt = select(ScanResult).where(
-                ScanResult.matched_torrent_hash.is_not(None),
-                ScanResult.checked.is_(False),
-            )
-            result_set = await session.execute(stmt)
-            scan_results = result_set.scalars().all()
+        async with self.read_session_maker() as session:
+            result_set = await session.execute(_GET_MATCHED_SCAN_RESULTS_STMT)
 
             result = {
-                scan_result.matched_torrent_hash: {
-                    "local_torrent_hash": scan_result.local_torrent_hash,
-                    "local_torrent_name": scan_result.local_torrent_name,
-                    "matched_torrent_id": scan_result.matched_torrent_id,
-                    "site_host": scan_result.site_host,
-                }
-                for scan_result in scan_results
-                if scan_result.matched_torrent_hash
+                matched_torrent_hash: MatchedScanResult(
+                    local_torrent_hash, local_torrent_name, matched_torrent_id, site_host
+                )
+                for matched_torrent_hash, local_torrent_hash, local_torrent_name, matched_torrent_id, site_host in (
+                    result_set.tuples()
+                )
+                if matched_torrent_hash
             }
             return result
 
@@ -313,6 +684,28 @@ class NemorosaDatabase:
             )
             await session.execute(stmt)
 
+    async def update_scan_results_checked(self, matched_torrent_hashes: list[str], checked: bool):
+        """Update checked status for multiple scan results in a single transaction.
+
+        Args:
+            matched_torrent_hashes: Matched torrent hashes.
+            checked: Checked status.
+        """
+        if not matched_torrent_hashes:
+            return
+
+        # SQLite has a limit on number of SQL variables (32766 after 3.32.0), one is used by checked
+        HASH_BATCH_SIZE = 32765
+
+        async with self.async_session_maker.begin() as session:
+            for i in range(0, len(matched_torrent_hashes), HASH_BATCH_SIZE):
+                stmt = (
+                    update(ScanResult)
+                    .where(ScanResult.matched_torrent_hash.in_(matched_torrent_hashes[i : i + HASH_BATCH_SIZE]))
+                    .values(checked=checked)
+                )
+                await session.execute(stmt)
+
     async def clear_matched_torrent_info(self, matched_torrent_hash: str):
         """Clear matched torrent information for a scan result.
 
@@ -331,6 +724,23 @@ class NemorosaDatabase:
 
     # region Job log
 
+    async def get_job_log(self, job_name: str) -> tuple[datetime | None, datetime | None, int]:
+        """Get last run, next run and run count for a job in a single lookup.
+
+        Args:
+            job_name: Name of the job.
+
+        Returns:
+            Tuple of last run datetime, next run datetime and run count, (None, None, 0) if never run.
+        """
+        async with self.read_session_maker() as session:
+            result = await session.execute(_GET_JOB_LOG_STMT, {"job_name": job_name})
+            row = result.one_or_none()
+            if row is None:
+                return None, None, 0
+            last_run, next_run, run_count = row
+            return last_run, next_run, run_count or 0
+
     async def get_job_last_run(self, job_name: str) -> datetime | None:
         """Get last run datetime for a job.
 
@@ -340,11 +750,8 @@ class NemorosaDatabase:
         Returns:
             Last run datetime, or None if never run.
         """
-        async with self.async_session_maker() as session:
-            stmt = select(JobLog.last_run).where(JobLog.job_name == job_name)
-            result = await session.execute(stmt)
-            last_run = result.scalar_one_or_none()
-            return last_run
+        last_run, _, _ = await self.get_job_log(job_name)
+        return last_run
 
     async def update_job_run(self, job_name: str, last_run: datetime, next_run: datetime | None = None):
         """Update job run information.
@@ -354,10 +761,10 @@ class NemorosaDatabase:
             last_run: Last run datetime.
             next_run: Next run datetime, or None.
         """
-        new_run_count = await self.get_job_run_count(job_name) + 1
         async with self.async_session_maker.begin() as session:
-            job_log = JobLog(job_name=job_name, last_run=last_run, next_run=next_run, run_count=new_run_count)
-            await session.merge(job_log)
+            await session.execute(
+                _UPDATE_JOB_RUN_STMT, {"job_name": job_name, "last_run": last_run, "next_run": next_run}
+            )
 
     async def get_job_run_count(self, job_name: str) -> int:
         """Get run count for a job.
@@ -368,11 +775,8 @@ class NemorosaDatabase:
         Returns:
             Number of times the job has run.
         """
-        async with self.async_session_maker() as session:
-            stmt = select(JobLog.run_count).where(JobLog.job_name == job_name)
-            result = await session.execute(stmt)
-            run_count = result.scalar_one_or_none()
-            return run_count if run_count is not None else 0
+        _, _, run_count = await self.get_job_log(job_name)
+        return run_count
 
     # endregion
 
@@ -384,23 +788,8 @@ class NemorosaDatabase:
         Args:
             torrent_info: ClientTorrentInfo object from clients.client_common.
         """
-        async with self.async_session_maker.begin() as session:
-            # Create ORM object from ClientTorrentInfo
-            client_torrent = ClientTorrent.from_client_info(torrent_info)
-            await session.merge(client_torrent)
-
-            # Delete old file records for this torrent
-            delete_stmt = delete(TorrentFile).where(TorrentFile.torrent_hash == torrent_info.hash)
-            await session.execute(delete_stmt)
-
-            # Insert file records
-            if torrent_info.files:
-                torrent_files = [
-                    TorrentFile(torrent_hash=torrent_info.hash, file_path=file_obj.name, file_size=file_obj.size)
-                    for file_obj in torrent_info.files
-                ]
-                for torrent_file in torrent_files:
-                    session.add(torrent_file)
+        # Same UPSERT and file replacement as the batch path, without merge()'s extra SELECT
+        await self.batch_save_client_torrents([torrent_info])
 
     async def get_all_cached_torrent_hashes(self) -> set[str]:
         """Get all cached torrent hashes.
@@ -408,10 +797,9 @@ class NemorosaDatabase:
         Returns:
             Set of all torrent hashes in cache.
         """
-        async with self.async_session_maker() as session:
-            stmt = select(ClientTorrent.hash)
-            result = await session.execute(stmt)
-            return {hash_val for (hash_val,) in result.all()}
+        async with self.read_session_maker() as session:
+            result = await session.execute(_GET_CACHED_HASHES_STMT)
+            return set(result.scalars())
 
     async def delete_client_torrents(self, torrent_hashes: str | list[str] | set[str]):
         """Delete torrent(s) and their files from cache.
@@ -451,9 +839,10 @@ class NemorosaDatabase:
         # - after 3.32.0 (2020-05-22): 32766 variables
         TORRENT_BATCH_SIZE = 6553  # 32765 // 5
         FILE_BATCH_SIZE = 10921  # 32765 // 3
+        OPTIMIZE_THRESHOLD = 1000
 
         async with self.async_session_maker.begin() as session:
-            # Process torrents in batches
+            # Process torrents chunk by chunk, so only one chunk of file rows is held in memory at a time
             for i in range(0, len(torrents), TORRENT_BATCH_SIZE):
                 batch = torrents[i : i + TORRENT_BATCH_SIZE]
 
@@ -464,7 +853,7 @@ class NemorosaDatabase:
                         "name": t.name,
                         "total_size": t.total_size,
                         "download_dir": t.download_dir or None,
-                        "trackers": msgspec.json.encode(t.trackers).decode() if t.trackers else None,
+                        "trackers": _json_encoder.encode(t.trackers) if t.trackers else None,
                     }
                     for t in batch
                 ]
@@ -483,30 +872,24 @@ class NemorosaDatabase:
                 )
                 await session.execute(stmt)
 
-            # Delete old files for all torrents in batches
-            all_hashes = [t.hash for t in torrents]
-            for i in range(0, len(all_hashes), TORRENT_BATCH_SIZE):
-                batch_hashes = all_hashes[i : i + TORRENT_BATCH_SIZE]
-                delete_stmt = delete(TorrentFile).where(TorrentFile.torrent_hash.in_(batch_hashes))
+                # Delete old files of this chunk
+                delete_stmt = delete(TorrentFile).where(TorrentFile.torrent_hash.in_([t.hash for t in batch]))
                 await session.execute(delete_stmt)
 
-            # Prepare file data for batch insert
-            file_data = [
-                {
-                    "torrent_hash": t.hash,
-                    "file_path": file.name,
-                    "file_size": file.size,
-                }
-                for t in torrents
-                if t.files
-                for file in t.files
-            ]
-
-            # Batch insert files in chunks to avoid SQL variable limit
-            for i in range(0, len(file_data), FILE_BATCH_SIZE):
-                batch = file_data[i : i + FILE_BATCH_SIZE]
-                file_stmt = insert(TorrentFile).values(batch)
-                await session.execute(file_stmt)
+                # Insert files of this chunk, flushing whenever the SQL variable limit is reached
+                file_data: list[dict[str, Any]] = []
+                for t in batch:
+                    for file in t.files:
+                        file_data.append({"torrent_hash": t.hash, "file_path": file.name, "file_size": file.size})
+                        if len(file_data) == FILE_BATCH_SIZE:
+                            await session.execute(insert(TorrentFile).values(file_data))
+                            file_data = []
+                if file_data:
+                    await session.execute(insert(TorrentFile).values(file_data))
+
+        # Large rebuilds change the table sizes enough for the planner statistics to go stale
+        if len(torrents) >= OPTIMIZE_THRESHOLD:
+            await self.optimize()
 
     async def get_all_client_torrents_basic(self) -> dict[str, tuple[str, str]]:
         """Get basic info (name, download_dir) for all cached torrents.
@@ -514,28 +897,29 @@ class NemorosaDatabase:
         Returns:
             Mapping from hash to (name, download_dir).
         """
-        async with self.async_session_maker() as session:
-            stmt = select(ClientTorrent.hash, ClientTorrent.name, ClientTorrent.download_dir)
-            result = await session.execute(stmt)
-            return {hash_val: (name, download_dir) for hash_val, name, download_dir in result.all()}
+        async with self.read_session_maker() as session:
+            result = await session.execute(_GET_CLIENT_TORRENTS_BASIC_STMT)
+            return {hash_val: (name, download_dir) for hash_val, name, download_dir in result.tuples()}
 
     async def search_torrent_by_file_match(
         self, target_file_size: int, fname_keywords: list[str]
-    ) -> list[dict[str, Any]]:
-        """Search torrents by file size and name keywords.
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Search torrents by file size and name keywords, streaming rows ordered by torrent hash.
 
         Args:
             target_file_size: Target file size to match.
             fname_keywords: List of keywords that should appear in file path.
 
-        Returns:
-            List of dictionaries containing torrent and file information.
+        Yields:
+            Dictionaries containing torrent and file information.
         """
-        async with self.async_session_maker() as session:
+        async with self.read_session_maker() as session:
             # Build conditions for matching files
             conditions = [TorrentFile.file_size == target_file_size]
+            # SQLite LIKE is already case-insensitive for ASCII, and its lower() only folds ASCII too,
+            # so wrapping file_path in lower() only added a function call per scanned row
             for keyword in fname_keywords:
-                conditions.append(func.lower(TorrentFile.file_path).like(f"%{keyword.lower()}%"))
+                conditions.append(TorrentFile.file_path.like(f"%{keyword}%"))
 
             # Subquery to find matching torrent hashes
             subquery = select(TorrentFile.torrent_hash).where(*conditions).distinct().subquery()
@@ -556,22 +940,17 @@ class NemorosaDatabase:
                 .order_by(ClientTorrent.hash, TorrentFile.file_path)
             )
 
-            result = await session.execute(stmt)
-            rows = result.all()
-
-            # Convert to list of dicts for compatibility
-            return [
-                {
-                    "hash": row.hash,
-                    "name": row.name,
-                    "download_dir": row.download_dir,
-                    "total_size": row.total_size,
-                    "trackers": row.trackers,
-                    "file_path": row.file_path,
-                    "file_size": row.file_size,
+            result = await session.stream(stmt)
+            async for hash_val, name, download_dir, total_size, trackers, file_path, file_size in result:
+                yield {
+                    "hash": hash_val,
+                    "name": name,
+                    "download_dir": download_dir,
+                    "total_size": total_size,
+                    "trackers": trackers,
+                    "file_path": file_path,
+                    "file_size": file_size,
                 }
-                for row in rows
-            ]
 
     # endregion
 
@@ -586,9 +965,8 @@ class NemorosaDatabase:
         Returns:
             Metadata value, or None if key doesn't exist.
         """
-        async with self.async_session_maker() as session:
-            stmt = select(Metadata.value).where(Metadata.key == key)
-            result = await session.execute(stmt)
+        async with self.read_session_maker() as session:
+            result = await session.execute(_GET_METADATA_STMT, {"key": key})
             return result.scalar_one_or_none()
 
     async def set_metadata(self, key: str, value: str | None):
@@ -599,8 +977,9 @@ class NemorosaDatabase:
             value: Metadata value.
         """
         async with self.async_session_maker.begin() as session:
-            metadata = Metadata(key=key, value=value)
-            await session.merge(metadata)
+            stmt = insert(Metadata).values(key=key, value=value)
+            stmt = stmt.on_conflict_do_update(index_elements=["key"], set_={"value": stmt.excluded.value})
+            await session.execute(stmt)
 
     async def delete_metadata(self, key: str):
         """Delete metadata by key.
@@ -614,14 +993,37 @@ class NemorosaDatabase:
 
     # endregion
 
+    async def checkpoint(self, mode: Literal["PASSIVE", "FULL", "RESTART", "TRUNCATE"] = "TRUNCATE"):
+        """Merge the WAL file into the main database to keep it from growing unbounded.
+
+        Args:
+            mode: Checkpoint mode, TRUNCATE checkpoints all frames and truncates the WAL file.
+        """
+        # Checkpoint must run outside a transaction, so skip BEGIN IMMEDIATE here
+        async with self.engine.connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text(f"PRAGMA wal_checkpoint({mode})"))
+
+    async def optimize(self, mask: int | None = None):
+        """Let SQLite refresh planner statistics (ANALYZE) for tables that changed significantly.
+
+        Args:
+            mask: Optional PRAGMA optimize bitmask, 0x10002 also analyzes tables without statistics.
+        """
+        pragma = "PRAGMA optimize" if mask is None else f"PRAGMA optimize={mask:#x}"
+        async with self.engine.connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            # Sample a bounded number of rows per index, so ANALYZE cost doesn't grow with torrent_files
+            await conn.execute(text(f"PRAGMA analysis_limit={_ANALYSIS_LIMIT}"))
+            await conn.execute(text(pragma))
+
     async def close(self):
         """Close database connection."""
+        await self.optimize()
         # Execute checkpoint to merge WAL file into main database
-        async with self.engine.connect() as conn:
-            # TRUNCATE mode: checkpoint all frames and truncate the WAL file
-            await conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
-            await conn.commit()
+        await self.checkpoint("TRUNCATE")
 
+        await self.read_engine.dispose()
         await self.engine.dispose()
 
 
@@ -633,6 +1035,9 @@ _db_lock = threading.Lock()
 async def cleanup_database():
     """Cleanup global database instance."""
     global _db_instance
+    if _db_instance is None:
+        return
+
     with _db_lock:
         db_to_close = _db_instance
         _db_instance = None
@@ -651,6 +1056,11 @@ def get_database(db_path: str | None = None) -> NemorosaDatabase:
         NemorosaDatabase: Database instance.
     """
     global _db_instance
+    # Fast path without locking once the instance exists
+    db_instance = _db_instance
+    if db_instance is not None:
+        return db_instance
+
     with _db_lock:
         if _db_instance is None:
             _db_instance = NemorosaDatabase(db_path)
@@ -7,9 +7,24 @@ from typing import TYPE_CHECKING
 
 from . import logger
 
+try:
+    # google-re2 matches in linear time and is noticeably faster on long filenames
+    import re2 as _sanitize_re
+except ImportError:
+    _sanitize_re = re
+
 if TYPE_CHECKING:
     from .clients import ClientTorrentInfo
 
+# Garbled characters, special symbols and invisible characters replaced in filename queries
+_SANITIZE_CHARS = frozenset(
+    "?？�_-.·~`!@#$%^&*+=|\\:\";'<>,/\u200b\u200c\u200d\u2060\ufeff\u00a0\u180e\u2028\u2029\u202f\u205f\u3000"
+) | frozenset(map(chr, [*range(0x2000, 0x200B), *range(0x00, 0x20), *range(0x7F, 0xA0)]))
+_SANITIZE_PATTERN = _sanitize_re.compile("[" + "".join(map(re.escape, sorted(_SANITIZE_CHARS))) + "]")
+
+# Lowercased extensions (with leading dot) treated as music files
+MUSIC_EXTENSIONS = frozenset({".flac", ".mp3", ".dsf", ".dff", ".m4a"})
+
 
 def is_music_file(filename: str) -> bool:
     """Check if a file is a music file based on its extension.
@@ -20,7 +35,19 @@ def is_music_file(filename: str) -> bool:
     Returns:
         bool: True if the file is a music file, False otherwise.
     """
-    return posixpath.splitext(filename)[1].lower() in [".flac", ".mp3", ".dsf", ".dff", ".m4a"]
+    return is_music_file_ext(posixpath.splitext(filename)[1].lower())
+
+
+def is_music_file_ext(ext: str) -> bool:
+    """Check if an already split, lowercased extension belongs to a music file.
+
+    Args:
+        ext (str): The extension including the leading dot, e.g. ".flac".
+
+    Returns:
+        bool: True if the extension is a music extension, False otherwise.
+    """
+    return ext in MUSIC_EXTENSIONS
 
 
 def make_filename_query(filename: str) -> str:
@@ -47,14 +74,10 @@ def make_filename_query(filename: str) -> str:
 
     # Replace common garbled characters and invisible characters with equal-length spaces
     # Including zero-width spaces, control characters, and other invisible Unicode characters
-    sanitized_name = re.sub(
-        r'[?？�_\-.·~`!@#$%^&*+=|\\:";\'<>,/\u200b\u200c\u200d\u2060\ufeff\u00a0\u180e\u2000-\u200a\u2028\u2029\u202f\u205f\u3000\u0000-\u001f\u007f-\u009f]',
-        " ",
-        sanitized_name,
-    )
+    sanitized_name = _SANITIZE_PATTERN.sub(" ", sanitized_name)
 
     # Finally merge consecutive multiple spaces into single space
-    sanitized_name = re.sub(r"\s+", " ", sanitized_name).strip()
+    sanitized_name = " ".join(sanitized_name.split())
 
     return sanitized_name
 
@@ -287,8 +310,8 @@ def should_keep_partial_torrent(torrent: "ClientTorrentInfo") -> bool:
     if not torrent.piece_progress or not torrent.files:
         return False
 
-    # Count continuous blocks of undownloaded pieces (False values)
-    undownloaded_blocks_count = sum(1 for value, _ in groupby(torrent.piece_progress) if not value)
+    # Count continuous blocks of undownloaded pieces (runs of 0 bytes between downloaded ones)
+    undownloaded_blocks_count = sum(1 for block in torrent.piece_progress.split(b"\x01") if block)
 
     # Count continuous blocks of files with zero progress (completely undownloaded)
     zero_progress_count = sum(1 for value, _ in groupby(torrent.files, key=lambda f: f.progress == 0.0) if value)
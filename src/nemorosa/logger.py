@@ -22,6 +22,10 @@ class LogColor(Enum):
     CRITICAL = "bright_red"
 
 
+# ANSI colors only make sense on a terminal, not when logs go to a file, journald or docker
+_USE_COLORS = sys.stderr.isatty()
+
+
 def setup_logger(loglevel="info"):
     """Setup the nemorosa logger with uvicorn-style formatting and colors.
 
@@ -39,7 +43,7 @@ def setup_logger(loglevel="info"):
 
     # Create console handler with colored formatter
     handler = logging.StreamHandler(sys.stderr)
-    handler.setFormatter(DefaultFormatter(fmt="%(levelprefix)s %(message)s"))
+    handler.setFormatter(DefaultFormatter(fmt="%(levelprefix)s %(message)s", use_colors=_USE_COLORS))
     logger.addHandler(handler)
 
     # Prevent propagation to avoid duplicate logs
@@ -50,37 +54,63 @@ def setup_logger(loglevel="info"):
 _logger = logging.getLogger("nemorosa")
 
 
+# Resolved color names, so log calls skip the Enum attribute lookups
+_SUCCESS_COLOR = LogColor.SUCCESS.value
+_HEADER_COLOR = LogColor.HEADER.value
+_SECTION_COLOR = LogColor.SECTION.value
+_PROMPT_COLOR = LogColor.PROMPT.value
+_ERROR_COLOR = LogColor.ERROR.value
+_CRITICAL_COLOR = LogColor.CRITICAL.value
+_DEBUG_COLOR = LogColor.DEBUG.value
+_WARNING_COLOR = LogColor.WARNING.value
+
+
+# Levels checked before styling, so disabled debug/info calls cost no string work
+_DEBUG = logging.DEBUG
+_INFO = logging.INFO
+
+
+def _style(msg, color: str):
+    """Color message for terminals, leave it untouched when output is redirected."""
+    return click.style(str(msg), fg=color) if _USE_COLORS else msg
+
+
 # Convenience functions for colored logging
 def success(msg, *args, **kwargs):
-    _logger.info(click.style(str(msg), fg=LogColor.SUCCESS.value), *args, **kwargs)
+    if _logger.isEnabledFor(_INFO):
+        _logger.info(_style(msg, _SUCCESS_COLOR), *args, **kwargs)
 
 
 def header(msg, *args, **kwargs):
-    _logger.info(click.style(str(msg), fg=LogColor.HEADER.value), *args, **kwargs)
+    if _logger.isEnabledFor(_INFO):
+        _logger.info(_style(msg, _HEADER_COLOR), *args, **kwargs)
 
 
 def section(msg, *args, **kwargs):
-    _logger.info(click.style(str(msg), fg=LogColor.SECTION.value), *args, **kwargs)
+    if _logger.isEnabledFor(_INFO):
+        _logger.info(_style(msg, _SECTION_COLOR), *args, **kwargs)
 
 
 def prompt(msg, *args, **kwargs):
-    _logger.info(click.style(str(msg), fg=LogColor.PROMPT.value), *args, **kwargs)
+    if _logger.isEnabledFor(_INFO):
+        _logger.info(_style(msg, _PROMPT_COLOR), *args, **kwargs)
 
 
 def error(msg, *args, **kwargs):
-    _logger.error(click.style(str(msg), fg=LogColor.ERROR.value), *args, **kwargs)
+    _logger.error(_style(msg, _ERROR_COLOR), *args, **kwargs)
 
 
 def critical(msg, *args, **kwargs):
-    _logger.critical(click.style(str(msg), fg=LogColor.CRITICAL.value), *args, **kwargs)
+    _logger.critical(_style(msg, _CRITICAL_COLOR), *args, **kwargs)
 
 
 def debug(msg, *args, **kwargs):
-    _logger.debug(click.style(str(msg), fg=LogColor.DEBUG.value), *args, **kwargs)
+    if _logger.isEnabledFor(_DEBUG):
+        _logger.debug(_style(msg, _DEBUG_COLOR), *args, **kwargs)
 
 
 def warning(msg, *args, **kwargs):
-    _logger.warning(click.style(str(msg), fg=LogColor.WARNING.value), *args, **kwargs)
+    _logger.warning(_style(msg, _WARNING_COLOR), *args, **kwargs)
 
 
 def info(msg, *args, **kwargs):
@@ -1,7 +1,9 @@
 """Scheduler module for nemorosa."""
 
+import time
 from datetime import UTC, datetime
 from enum import Enum
+from typing import TYPE_CHECKING
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -9,6 +11,9 @@ from pydantic import BaseModel, Field
 
 from . import config, db, logger
 
+if TYPE_CHECKING:
+    from .core import NemorosaCore
+
 
 class JobResponse(BaseModel):
     """Job response model."""
@@ -18,6 +23,7 @@ class JobResponse(BaseModel):
     job_name: str | None = Field(default=None, description="Job name")
     next_run: str | None = Field(default=None, description="Next scheduled run time")
     last_run: str | None = Field(default=None, description="Last run time")
+    run_count: int | None = Field(default=None, description="Number of times the job has run")
 
     model_config = {
         "json_schema_extra": {
@@ -33,9 +39,27 @@ class JobType(Enum):
     CLEANUP = "cleanup"
 
 
+def _get_job_jitter(interval: int) -> int:
+    """Get the random delay applied to job runs, so jobs with aligned intervals don't start together.
+
+    Args:
+        interval: Job interval in seconds.
+
+    Returns:
+        int: Jitter in seconds, 0 disables it.
+    """
+    jitter = config.cfg.server.job_jitter_seconds
+    if jitter is None:
+        # About 5% of the interval, clamped to a range that stays negligible for the schedule
+        jitter = min(60, max(5, interval // 20))
+    return jitter
+
+
 class JobManager:
     """Job manager for handling scheduled tasks."""
 
+    __slots__ = ("scheduler", "database", "_running_jobs", "_core")
+
     def __init__(self):
         """Initialize job manager."""
         self.scheduler = AsyncIOScheduler()
@@ -43,6 +67,24 @@ class JobManager:
         self.database = db.get_database()
         # Track running jobs
         self._running_jobs = set()
+        # Processor shared by all job runs for the scheduler lifetime, created on first run. Search runs
+        # reset their per-run state and never overlap on it, cleanup keeps its stats local to each call
+        self._core: NemorosaCore | None = None
+
+    def _get_core(self) -> "NemorosaCore":
+        """Get the processor shared by scheduled jobs, creating it on first use.
+
+        It is created lazily because the torrent client and target APIs are only
+        configured once the application has started.
+
+        Returns:
+            NemorosaCore: Shared processor instance.
+        """
+        if self._core is None:
+            from .core import NemorosaCore
+
+            self._core = NemorosaCore()
+        return self._core
 
     async def start_scheduler(self):
         """Start the scheduler and add configured periodic jobs.
@@ -57,22 +99,34 @@ class JobManager:
     def add_scheduled_jobs(self):
         """Add configured periodic jobs to the scheduler."""
 
-        # Add search job if configured
-        if config.cfg.server.search_cadence_seconds:
-            self._add_search_job()
+        # Resolve cadences once, they are fixed for the lifetime of the configuration
+        search_interval = config.cfg.server.search_cadence_seconds
+        cleanup_interval = config.cfg.server.cleanup_cadence_seconds
+
+        # Add search job if configured. Sub-second cadences truncate to 0, which APScheduler
+        # would turn into a job firing every second, so those are skipped as well
+        if search_interval > 0:
+            self._add_search_job(search_interval)
+        elif config.cfg.server.search_cadence is not None:
+            logger.warning(f"search_cadence '{config.cfg.server.search_cadence}' is under 1 second, not scheduled")
 
         # Add cleanup job
-        self._add_cleanup_job()
+        if cleanup_interval > 0:
+            self._add_cleanup_job(cleanup_interval)
+        else:
+            logger.warning(f"cleanup_cadence '{config.cfg.server.cleanup_cadence}' is under 1 second, not scheduled")
         logger.info("Scheduled jobs added successfully")
 
-    def _add_search_job(self):
-        """Add search job to scheduler."""
-        try:
-            interval = config.cfg.server.search_cadence_seconds
+    def _add_search_job(self, interval: int):
+        """Add search job to scheduler.
 
+        Args:
+            interval: Search cadence in seconds.
+        """
+        try:
             self.scheduler.add_job(
                 self._run_search_job,
-                trigger=IntervalTrigger(seconds=interval),
+                trigger=IntervalTrigger(seconds=interval, jitter=_get_job_jitter(interval)),
                 id=JobType.SEARCH.value,
                 name="Search Job",
                 max_instances=1,
@@ -84,14 +138,16 @@ class JobManager:
         except Exception as e:
             logger.error(f"Failed to add search job: {e}")
 
-    def _add_cleanup_job(self):
-        """Add cleanup job to scheduler."""
-        try:
-            interval = config.cfg.server.cleanup_cadence_seconds
+    def _add_cleanup_job(self, interval: int):
+        """Add cleanup job to scheduler.
 
+        Args:
+            interval: Cleanup cadence in seconds.
+        """
+        try:
             self.scheduler.add_job(
                 self._run_cleanup_job,
-                trigger=IntervalTrigger(seconds=interval),
+                trigger=IntervalTrigger(seconds=interval, jitter=_get_job_jitter(interval)),
                 id=JobType.CLEANUP.value,
                 name="Cleanup Job",
                 max_instances=1,
@@ -111,8 +167,9 @@ class JobManager:
         self._running_jobs.add(job_name)
 
         try:
-            # Record job start
+            # Record job start, wall clock for the job log and monotonic clock for the duration
             start_time = datetime.now(UTC)
+            start_monotonic = time.monotonic()
 
             # Get next run time from APScheduler
             next_run_time = None
@@ -123,9 +180,7 @@ class JobManager:
             await self.database.update_job_run(job_name, start_time, next_run_time)
 
             # Run the actual search process
-            from .core import NemorosaCore
-
-            processor = NemorosaCore()
+            processor = self._get_core()
             await processor.process_torrents()
 
             client = processor.torrent_client
@@ -134,8 +189,7 @@ class JobManager:
                 await client.wait_for_monitoring_completion()
 
             # Record successful completion
-            end_time = datetime.now(UTC)
-            duration = (end_time - start_time).total_seconds()
+            duration = time.monotonic() - start_monotonic
             logger.debug(f"Completed {job_name} job in {duration:.2f} seconds")
 
         except Exception as e:
@@ -152,8 +206,9 @@ class JobManager:
         self._running_jobs.add(job_name)
 
         try:
-            # Record job start
+            # Record job start, wall clock for the job log and monotonic clock for the duration
             start_time = datetime.now(UTC)
+            start_monotonic = time.monotonic()
 
             # Get next run time from APScheduler
             next_run_time = None
@@ -164,17 +219,14 @@ class JobManager:
             await self.database.update_job_run(job_name, start_time, next_run_time)
 
             # Run cleanup process
-            from .core import NemorosaCore
-
-            processor = NemorosaCore()
+            processor = self._get_core()
             await processor.retry_undownloaded_torrents()
 
             # Then post-process injected torrents
             await processor.post_process_injected_torrents()
 
             # Record successful completion
-            end_time = datetime.now(UTC)
-            duration = (end_time - start_time).total_seconds()
+            duration = time.monotonic() - start_monotonic
             logger.debug(f"Completed {job_name} job in {duration:.2f} seconds")
 
         except Exception as e:
@@ -215,7 +267,8 @@ class JobManager:
                     job_name=job_name,
                 )
 
-            self.scheduler.modify_job(job_name, next_run_time=datetime.now(UTC))
+            # Modify through the job already looked up, its jobstore alias skips searching every jobstore again
+            job.modify(next_run_time=datetime.now(UTC))
 
             logger.debug(f"Successfully triggered {job_name} job")
             result = JobResponse(
@@ -256,8 +309,8 @@ class JobManager:
         # Check if job is currently running
         is_running = job_name in self._running_jobs
 
-        # Get last run time from database
-        last_run_dt = await self.database.get_job_last_run(job_name)
+        # Get last run time and run count from database in one lookup
+        last_run_dt, _, run_count = await self.database.get_job_log(job_name)
         last_run = last_run_dt.isoformat() if last_run_dt else None
 
         # Determine status based on running state
@@ -274,6 +327,7 @@ class JobManager:
             job_name=job_name,
             next_run=job.next_run_time.isoformat() if job.next_run_time else None,
             last_run=last_run,
+            run_count=run_count,
         )
 
     def stop_scheduler(self):
@@ -352,7 +352,7 @@ async def get_job_status(
     """Get the current status and schedule of a job.
 
     Retrieves information about a scheduled job including its status,
-    next run time, and last run time.
+    next run time, last run time, and run count.
 
     Args:
         job_type: Type of job to get status for (search, cleanup)
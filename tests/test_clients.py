@@ -0,0 +1,169 @@
+"""Tests for shared torrent client helpers."""
+
+import asyncio
+import threading
+
+import pytest
+
+from nemorosa import db, scheduler
+from nemorosa.clients import ClientTorrentInfo, TorrentClient
+from nemorosa.clients.client_common import decode_bitfield_bytes
+
+# region decode_bitfield_bytes
+
+
+def test_decode_bitfield_bytes_msb_first():
+    assert decode_bitfield_bytes(b"\xa0", 3) == b"\x01\x00\x01"
+    assert decode_bitfield_bytes(b"\xff\x80", 9) == b"\x01" * 9
+
+
+def test_decode_bitfield_bytes_pads_short_bitfield():
+    assert decode_bitfield_bytes(b"\xff", 10) == b"\x01" * 8 + b"\x00\x00"
+    assert decode_bitfield_bytes(b"", 4) == b"\x00" * 4
+
+
+def test_decode_bitfield_bytes_ignores_trailing_data():
+    assert decode_bitfield_bytes(b"\xff\xff", 4) == b"\x01" * 4
+    assert decode_bitfield_bytes(b"\xff", 0) == b""
+
+
+# endregion
+
+# region _get_torrent_infos_batched
+
+
+class FakeClient(TorrentClient):
+    """Client answering get_torrents from a fixed set of hashes, recording every call."""
+
+    def __init__(self, hashes: set[str]):
+        super().__init__()
+        self.hashes = hashes
+        self.calls: list[tuple[set[str], list[str]]] = []
+        # Set to make get_torrents block until released, for cancellation during the RPC
+        self.release: threading.Event | None = None
+
+    def get_torrents(self, torrent_hashes=None, fields=None):
+        self.calls.append((set(torrent_hashes), fields))
+        if self.release is not None:
+            self.release.wait(5)
+        return [ClientTorrentInfo(hash=torrent_hash) for torrent_hash in torrent_hashes if torrent_hash in self.hashes]
+
+    def get_torrent_info(self, torrent_hash, fields):
+        return None
+
+    def get_torrents_for_monitoring(self, torrent_hashes):
+        return {}
+
+    def _add_torrent(self, torrent_data, download_dir, hash_match):
+        raise NotImplementedError
+
+    def _remove_torrent(self, torrent_hash):
+        raise NotImplementedError
+
+    def _rename_torrent(self, torrent_hash, old_name, new_name):
+        raise NotImplementedError
+
+    def _rename_file(self, torrent_hash, old_path, new_name):
+        raise NotImplementedError
+
+    def _verify_torrent(self, torrent_hash):
+        raise NotImplementedError
+
+    def _process_rename_map(self, torrent_hash, base_path, rename_map):
+        return rename_map
+
+    def _get_torrent_data(self, torrent_hash):
+        return None
+
+    def _resume_torrent(self, torrent_hash):
+        return False
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    monkeypatch.setattr(scheduler, "get_job_manager", lambda: None)
+    monkeypatch.setattr(db, "get_database", lambda: None)
+    clients = []
+
+    def make(hashes: set[str]) -> FakeClient:
+        client = FakeClient(hashes)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        if client.release is not None:
+            client.release.set()
+        client._rpc_executor.shutdown(wait=True)
+
+
+def test_batched_lookups_share_one_rpc(make_client):
+    client = make_client({"a", "b", "c"})
+
+    async def run():
+        return await asyncio.gather(
+            client._get_torrent_infos_batched(["a", "x"], ["state"]),
+            client._get_torrent_infos_batched(["b"], ["state"]),
+        )
+
+    first, second = asyncio.run(run())
+
+    assert list(first) == ["a"]
+    assert list(second) == ["b"]
+    assert client.calls == [({"a", "x", "b"}, ["hash", "state"])]
+    assert client._info_batches == {}
+
+
+def test_batched_lookup_alone_skips_window(make_client):
+    client = make_client({"a"})
+
+    async def run():
+        # A lone lookup must not sit out the window waiting for company
+        return await asyncio.wait_for(client._get_torrent_infos_batched(["a"], ["state"], window=5), timeout=1)
+
+    assert list(asyncio.run(run())) == ["a"]
+    assert len(client.calls) == 1
+
+
+def test_batched_lookup_cancelled_during_window(make_client):
+    client = make_client({"a", "b"})
+
+    async def run():
+        waiters = [
+            asyncio.create_task(client._get_torrent_infos_batched([torrent_hash], ["state"], window=5))
+            for torrent_hash in ("a", "b")
+        ]
+        await asyncio.sleep(0.05)
+        (_, _, flush_task) = client._info_batches[("hash", "state")]
+        flush_task.cancel()
+        return await asyncio.gather(*waiters, return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    assert client.calls == []
+    assert client._info_batches == {}
+
+
+def test_batched_lookup_cancelled_during_rpc(make_client):
+    client = make_client({"a"})
+    client.release = threading.Event()
+
+    async def run():
+        waiter = asyncio.create_task(client._get_torrent_infos_batched(["a"], ["state"]))
+        await asyncio.sleep(0)
+        (_, _, flush_task) = client._info_batches[("hash", "state")]
+        # Wait until the flush is blocked inside get_torrents on the RPC thread
+        while not client.calls:
+            await asyncio.sleep(0.01)
+        flush_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(waiter, timeout=1)
+        client.release.set()
+
+    asyncio.run(run())
+
+    assert client._info_batches == {}
+
+
+# endregion
@@ -0,0 +1,193 @@
+"""Tests for the database schema migration and batch write helpers."""
+
+import asyncio
+import contextlib
+
+from sqlalchemy import create_engine
+
+from nemorosa import db
+from nemorosa.clients import ClientTorrentFile, ClientTorrentInfo
+
+
+@contextlib.asynccontextmanager
+async def open_database(tmp_path):
+    # Engines are bound to the running loop, so each test opens and closes its own database inside it
+    database = db.NemorosaDatabase(str(tmp_path / "nemorosa.db"))
+    await database.init_database()
+    try:
+        yield database
+    finally:
+        await database.close()
+
+
+# region job_log migration
+
+
+def _job_log_sql(conn) -> str:
+    return conn.exec_driver_sql("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'job_log'").scalar()
+
+
+def test_migrate_job_log_without_rowid_keeps_rows(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        # job_log as created by earlier versions, a regular rowid table
+        conn.exec_driver_sql(
+            "CREATE TABLE job_log (job_name VARCHAR NOT NULL PRIMARY KEY, last_run DATETIME, next_run DATETIME, "
+            "run_count INTEGER DEFAULT '1' NOT NULL, created_at DATETIME DEFAULT (CURRENT_TIMESTAMP) NOT NULL)"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO job_log (job_name, last_run, next_run, run_count, created_at) "
+            "VALUES ('search', '2025-01-01 00:00:00', NULL, 7, '2024-12-31 00:00:00')"
+        )
+
+    with engine.begin() as conn:
+        db._migrate_job_log_without_rowid(conn)
+
+    with engine.connect() as conn:
+        assert "WITHOUT ROWID" in _job_log_sql(conn).upper()
+        rows = conn.exec_driver_sql("SELECT job_name, run_count, created_at FROM job_log").all()
+        assert rows == [("search", 7, "2024-12-31 00:00:00")]
+        leftover = conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE name = 'job_log_old'").scalar()
+        assert leftover is None
+    engine.dispose()
+
+
+def test_migrate_job_log_without_rowid_is_noop_when_current_or_missing(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'new.db'}")
+    with engine.begin() as conn:
+        # Missing table: nothing to migrate
+        db._migrate_job_log_without_rowid(conn)
+        assert _job_log_sql(conn) is None
+
+        db.JobLog.__table__.create(conn)
+        table_sql = _job_log_sql(conn)
+        db._migrate_job_log_without_rowid(conn)
+        assert _job_log_sql(conn) == table_sql
+    engine.dispose()
+
+
+# endregion
+
+# region Batch upserts
+
+
+def test_add_scan_results_upserts_and_keeps_checked(tmp_path):
+    async def run():
+        async with open_database(tmp_path) as database:
+            await database.add_scan_results(
+                [
+                    {
+                        "local_torrent_hash": "a" * 40,
+                        "local_torrent_name": "Album",
+                        "matched_torrent_id": "1",
+                        "site_host": "site.example",
+                        "matched_torrent_hash": "b" * 40,
+                    },
+                    {
+                        "local_torrent_hash": "c" * 40,
+                        "local_torrent_name": "Other",
+                        "matched_torrent_id": None,
+                        "site_host": "site.example",
+                        "matched_torrent_hash": None,
+                    },
+                ]
+            )
+            await database.update_scan_results_checked(["b" * 40], True)
+
+            # Same primary key again: the row is updated, checked is left untouched
+            await database.add_scan_results(
+                [
+                    {
+                        "local_torrent_hash": "a" * 40,
+                        "local_torrent_name": "Album (renamed)",
+                        "matched_torrent_id": "2",
+                        "site_host": "site.example",
+                        "matched_torrent_hash": "b" * 40,
+                    }
+                ]
+            )
+
+            assert await database.get_scanned_hashes("site.example") == {"a" * 40, "c" * 40}
+            assert await database.get_scanned_hashes("other.example") == set()
+            # The only match is checked, so nothing is left to post-process
+            assert await database.get_matched_scan_results() == {}
+
+            await database.update_scan_results_checked(["b" * 40], False)
+            matched = await database.get_matched_scan_results()
+            assert list(matched) == ["b" * 40]
+            assert matched["b" * 40].local_torrent_name == "Album (renamed)"
+            assert matched["b" * 40].matched_torrent_id == "2"
+
+    asyncio.run(run())
+
+
+def test_add_undownloaded_torrents_upserts(tmp_path):
+    async def run():
+        async with open_database(tmp_path) as database:
+            await database.add_undownloaded_torrents(
+                [
+                    {
+                        "torrent_id": "10",
+                        "site_host": "site.example",
+                        "download_dir": "/data",
+                        "local_torrent_name": "Album",
+                        "rename_map": {"a.flac": "b.flac"},
+                    }
+                ]
+            )
+            await database.add_undownloaded_torrents(
+                [
+                    {
+                        "torrent_id": "10",
+                        "site_host": "site.example",
+                        "download_dir": "/music",
+                        "local_torrent_name": "Album",
+                        "rename_map": None,
+                    },
+                    {
+                        "torrent_id": "11",
+                        "site_host": "site.example",
+                        "download_dir": "/data",
+                        "local_torrent_name": "Other",
+                        "rename_map": {"c.flac": "d.flac"},
+                    },
+                ]
+            )
+
+            torrents = await database.load_undownloaded_torrents("site.example")
+            assert set(torrents) == {"10", "11"}
+            assert torrents["10"].download_dir == "/music"
+            assert torrents["10"].rename_map == {}
+            assert torrents["11"].rename_map == {"c.flac": "d.flac"}
+
+    asyncio.run(run())
+
+
+def test_batch_save_client_torrents_replaces_files(tmp_path):
+    def torrent(name: str, download_dir: str, files: list[tuple[str, int]]) -> ClientTorrentInfo:
+        return ClientTorrentInfo(
+            hash="a" * 40,
+            name=name,
+            total_size=sum(size for _, size in files),
+            files=[ClientTorrentFile(name=path, size=size, progress=1.0) for path, size in files],
+            trackers=["https://tracker.example/announce"],
+            download_dir=download_dir,
+        )
+
+    async def run():
+        async with open_database(tmp_path) as database:
+            await database.batch_save_client_torrents(
+                [torrent("Album", "/data", [("Album/01.flac", 100), ("Album/02.flac", 200)])]
+            )
+            await database.batch_save_client_torrents([torrent("Album", "/music", [("Album/01.flac", 100)])])
+
+            assert await database.get_all_client_torrents_basic() == {"a" * 40: ("Album", "/music")}
+            # Files of the previous save are gone, only the new file list is searchable
+            rows = [row async for row in database.search_torrent_by_file_match(100, ["01"])]
+            assert [(row["hash"], row["file_path"]) for row in rows] == [("a" * 40, "Album/01.flac")]
+            assert [row async for row in database.search_torrent_by_file_match(200, ["02"])] == []
+
+    asyncio.run(run())
+
+
+# endregion
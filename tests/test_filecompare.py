@@ -0,0 +1,33 @@
+"""Tests for file comparison helpers."""
+
+from nemorosa.clients import ClientTorrentFile, ClientTorrentInfo
+from nemorosa.filecompare import should_keep_partial_torrent
+
+
+def _torrent(piece_progress: bytes, progresses: list[float]) -> ClientTorrentInfo:
+    return ClientTorrentInfo(
+        hash="a" * 40,
+        files=[ClientTorrentFile(name=f"{i:02}.flac", size=100, progress=p) for i, p in enumerate(progresses)],
+        piece_progress=piece_progress,
+    )
+
+
+def test_should_keep_partial_torrent_without_progress_data():
+    assert not should_keep_partial_torrent(_torrent(b"", [1.0, 0.0]))
+    assert not should_keep_partial_torrent(_torrent(b"\x01\x00", []))
+
+
+def test_should_keep_partial_torrent_single_missing_run():
+    # One run of missing pieces covered by one missing file
+    assert should_keep_partial_torrent(_torrent(b"\x01\x01\x00\x00\x01", [1.0, 0.0, 1.0]))
+    # Fully downloaded pieces never conflict
+    assert should_keep_partial_torrent(_torrent(b"\x01\x01\x01", [1.0, 1.0]))
+
+
+def test_should_keep_partial_torrent_more_runs_than_missing_files():
+    # Two separate runs of missing pieces but only one missing file: the data doesn't line up
+    assert not should_keep_partial_torrent(_torrent(b"\x00\x01\x00\x01", [1.0, 0.0, 1.0]))
+
+
+def test_should_keep_partial_torrent_adjacent_missing_files_form_one_run():
+    assert should_keep_partial_torrent(_torrent(b"\x01\x00\x00\x00\x01", [1.0, 0.0, 0.0, 1.0]))